@@ -0,0 +1,350 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+import numpy as np
+import pandas as pd
+
+from cash_flow_projection import CashFlowProjector
+from correlation import CorrelationEngine
+from data_frame_info import DataFrameInfo
+from data_tranform_class import DataTransform
+from db_utils import RDSDatabaseConnector
+from loan_analytics import LoanPortfolioAnalytics
+from plotter_class import Plotter
+from synthetic_loans import SyntheticLoanGenerator
+
+DATE_COLUMNS = ["issue_date", "earliest_credit_line", "last_payment_date", "last_credit_pull_date"]
+CATEGORICAL_COLUMNS = ["term", "grade", "sub_grade", "employment_length", "home_ownership", "verification_status",
+                       "loan_status", "payment_plan", "purpose", "application_type"]
+SKEWED_COLUMNS = ["annual_inc", "total_payment", "total_rec_int", "last_payment_amount"]
+IMPORT_MODULES = ["cash_flow_projection", "column_executor", "correlation", "data_frame_info", "data_tranform_class",
+                  "db_utils", "instrumentation", "loan_analytics", "outlier_detection", "plotter_class",
+                  "report_generator", "result_cache", "summary_statistics", "synthetic_loans"]
+LAZY_DEPENDENCIES = ["matplotlib", "seaborn", "statsmodels", "scipy", "psycopg2", "sqlalchemy"]
+
+
+class BenchmarkSuite:
+    """
+    A class for benchmarking extraction, loading, transformations, statistics and plots on synthetic loans.
+
+    Each benchmark is timed on a fresh copy of the synthetic data and reports wall time, peak
+    resident memory growth during the run (the peak sampled from /proc where available, minus
+    the resident memory at its start) and row throughput. The fastest time and the median memory
+    growth are taken independently across repeats, as memory growth varies by several MB between
+    identical runs. Results are saved as JSON and can be compared with a previous run to flag
+    regressions larger than both a relative tolerance and a noise floor; the memory floor grows
+    with the size of the synthetic data.
+
+    Attributes:
+        rows (int): Number of synthetic rows.
+        seed (int): Seed for the synthetic data.
+        repeat (int): Number of runs per benchmark; the fastest time and median memory growth are reported.
+        table_name (str, optional): Database table to benchmark extraction from, if credentials are available.
+        data_mb (float): In-memory size of the synthetic data in MB.
+        results (dict): Measurements per benchmark name.
+
+    Methods:
+        run(only=None): Run the benchmarks, optionally only those whose name contains one of the given strings.
+        check_imports(budget=0.25, repeat=5): Time importing the package in fresh interpreters and check it against a budget.
+        save(file_path, label=None): Save the results and environment details to a JSON file.
+        compare(baseline_file, tolerance=0.1, min_seconds=0.05, min_memory_mb=5.0, memory_noise=0.25): Compare the results with a saved run.
+    """
+    def __init__(self, rows=100000, seed=0, repeat=5, table_name=None):
+        self.rows = int(rows)
+        self.seed = seed
+        self.repeat = repeat
+        self.table_name = table_name
+        self.results = {}
+        self.df = SyntheticLoanGenerator(seed=seed).generate(self.rows)
+        self.data_mb = self.df.memory_usage(deep=True).sum() / 1024 ** 2
+
+    def _benchmarks(self, directory):
+        """
+        List (name, setup, run) tuples; setup's return value is passed to run and is not timed.
+        """
+        df = self.df
+        csv_path = os.path.join(directory, "loans.csv")
+        parquet_path = os.path.join(directory, "loans.parquet")
+        plot_path = os.path.join(directory, "plot.png")
+        connector = RDSDatabaseConnector(credentials_file="credentials.yaml" if self.table_name else None)
+        numeric = list(df.select_dtypes('number').columns)
+
+        def write_csv():
+            if not os.path.exists(csv_path):
+                connector.save_data_to_csv(df, csv_path, index=False)
+
+        def write_parquet():
+            if not os.path.exists(parquet_path):
+                connector.save_data_to_cache(df, parquet_path)
+
+        def transform(method, *args):
+            return (lambda: DataTransform(df.copy()), lambda transformer: getattr(transformer, method)(*args))
+
+        def info(method, *args):
+            return (lambda: DataFrameInfo(df), lambda frame_info: getattr(frame_info, method)(*args))
+
+        def plot(method, *args):
+            return (lambda: Plotter(df), lambda plotter: getattr(plotter, method)(*args, save_path=plot_path))
+
+        benchmarks = [
+            ("load.save_csv", lambda: None, lambda _: connector.save_data_to_csv(df, csv_path, index=False)),
+            ("load.load_csv", write_csv, lambda _: connector.load_data_from_csv(csv_path)),
+            ("load.save_parquet", lambda: None, lambda _: connector.save_data_to_cache(df, parquet_path)),
+            ("load.load_parquet", write_parquet, lambda _: connector.load_data_from_cache(parquet_path)),
+            ("load.load_parquet_columns", write_parquet, lambda _: connector.load_data_from_cache(parquet_path, columns=numeric[:4])),
+            ("transform.convert_dates_to_datetime", *transform("convert_dates_to_datetime", DATE_COLUMNS)),
+            ("transform.convert_categorical_columns", *transform("convert_categorical_columns", CATEGORICAL_COLUMNS)),
+            ("transform.drop_rows", *transform("drop_rows", ["last_payment_date", "last_credit_pull_date"])),
+            ("transform.impute_mean", *transform("impute_mean", "int_rate")),
+            ("transform.impute_mode", *transform("impute_mode", "employment_length")),
+            ("transform.log_transform", *transform("log_transform", "annual_inc")),
+            ("transform.boxcox_transform", *transform("boxcox_transform", ["loan_amount", "instalment"])),
+            ("transform.remove_outliers_zscore", *transform("remove_outliers_zscore", SKEWED_COLUMNS)),
+            ("transform.remove_outliers_iqr", *transform("remove_outliers", SKEWED_COLUMNS, "iqr")),
+            ("transform.optimise_memory", *transform("optimise_memory")),
+            ("statistics.extract_statistical_values", *info("extract_statistical_values")),
+            ("statistics.count_distinct_values", *info("count_distinct_values")),
+            ("statistics.count_null_values", *info("count_null_values")),
+            ("statistics.data_skew", *info("data_skew", numeric)),
+            ("statistics.profile", *info("profile")),
+            ("statistics.profile_chunks", lambda: DataFrameInfo(
+                df.iloc[start:start + 100000] for start in range(0, len(df), 100000)
+            ), lambda frame_info: frame_info.profile()),
+            ("statistics.correlation", lambda: CorrelationEngine(numeric), lambda engine: engine.compute(df)),
+            ("analytics.portfolio_by_grade", lambda: LoanPortfolioAnalytics("grade"), lambda analytics: analytics.analyse(df)),
+            ("analytics.cash_flow_projection", lambda: None, lambda _: CashFlowProjector(df).scenarios({"baseline": None, "late": "Late"})),
+            ("plot.histogram", *plot("histogram", "loan_amount")),
+            ("plot.kde_plot", *plot("kde_plot", "loan_amount")),
+            ("plot.correlation_heatmap", *plot("correlation_heatmap", numeric)),
+        ]
+        if self.table_name and connector.credentials:
+            benchmarks.insert(0, ("extract.partitioned", lambda: None,
+                                  lambda _: connector.extract_partitioned_data(self.table_name)))
+        return benchmarks
+
+    def run(self, only=None):
+        """
+        Run the benchmarks.
+
+        Args:
+            only (list, optional): Run only benchmarks whose name contains one of these strings.
+
+        Returns:
+            dict: Measurements per benchmark name.
+        """
+        with tempfile.TemporaryDirectory(prefix="eda_benchmarks_") as directory:
+            for name, setup, run in self._benchmarks(directory):
+                if only and not any(part in name for part in only):
+                    continue
+                measurements = []
+                for _ in range(self.repeat):
+                    subject = setup()
+                    measurements.append(_measure(lambda: run(subject)))
+                best = {
+                    "seconds": min(measurement["seconds"] for measurement in measurements),
+                    "rss_growth_mb": float(np.median([measurement["rss_growth_mb"] for measurement in measurements])),
+                }
+                best["rows_per_second"] = self.rows / best["seconds"] if best["seconds"] > 0 else None
+                self.results[name] = best
+                print(f"{name:45s} {best['seconds']:9.4f}s {best['rss_growth_mb']:9.1f} MB {best['rows_per_second'] or 0:14,.0f} rows/s")
+        return self.results
+
+    def check_imports(self, budget=0.25, repeat=5):
+        """
+        Time importing every module of the package in fresh interpreters and check it against a budget.
+
+        numpy and pandas are imported first and not counted, so the time measured is the package's own
+        import cost. The check fails if the fastest import exceeds the budget, or if any of the heavy
+        dependencies that should load lazily on first use is imported.
+
+        Args:
+            budget (float): Maximum import time in seconds.
+            repeat (int): Number of fresh interpreters; the fastest import is reported.
+
+        Returns:
+            bool: Whether the import time is within budget and no heavy dependency was loaded.
+        """
+        code = (
+            "import json, sys, time; import numpy, pandas; start = time.perf_counter(); "
+            f"import {', '.join(IMPORT_MODULES)}; seconds = time.perf_counter() - start; "
+            f"print(json.dumps([seconds, [name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules]]))"
+        )
+        directory = os.path.dirname(os.path.abspath(__file__))
+        runs = [
+            json.loads(subprocess.run([sys.executable, "-c", code], cwd=directory, capture_output=True, text=True, check=True).stdout)
+            for _ in range(repeat)
+        ]
+        seconds = min(run[0] for run in runs)
+        loaded = sorted({name for run in runs for name in run[1]})
+        self.results["import.package"] = {"seconds": seconds, "rss_growth_mb": None, "rows_per_second": None}
+        within_budget = seconds <= budget and not loaded
+        print(f"{'import.package':45s} {seconds:9.4f}s (budget {budget}s)"
+              + (f", eagerly loaded: {', '.join(loaded)}" if loaded else ""))
+        return within_budget
+
+    def save(self, file_path, label=None):
+        """
+        Save the results and environment details to a JSON file.
+
+        Args:
+            file_path (str): Path of the JSON file.
+            label (str, optional): Name of the version benchmarked. Defaults to the current git commit.
+        """
+        record = {
+            "label": label or _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "rows": self.rows,
+            "seed": self.seed,
+            "data_mb": self.data_mb,
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "results": self.results,
+        }
+        with open(file_path, "w") as file:
+            json.dump(record, file, indent=2)
+        print(f"Benchmark results saved to {file_path}.")
+
+    def compare(self, baseline_file, tolerance=0.1, min_seconds=0.05, min_memory_mb=5.0, memory_noise=0.25):
+        """
+        Compare the results with a saved run.
+
+        A benchmark counts as a regression only if it is slower or grows memory by more than
+        tolerance and by more than the noise floor, so short runs are not flagged for jitter.
+        The memory floor is min_memory_mb plus memory_noise times the size of the synthetic data,
+        as allocator noise grows with the size of the frames a benchmark copies.
+
+        Args:
+            baseline_file (str): JSON file written by save().
+            tolerance (float): Relative slowdown or memory growth above which a benchmark counts as a regression.
+            min_seconds (float): Slowdown in seconds below which a benchmark never counts as a regression.
+            min_memory_mb (float): Memory growth in MB below which a benchmark never counts as a regression.
+            memory_noise (float): Fraction of the synthetic data's size added to min_memory_mb.
+
+        Returns:
+            pd.DataFrame: Baseline and current time and memory per benchmark, with their ratios and a regression flag.
+        """
+        with open(baseline_file, "r") as file:
+            baseline = json.load(file)
+        if baseline["rows"] != self.rows:
+            print(f"Warning: baseline ran on {baseline['rows']} rows, this run on {self.rows}.")
+        memory_floor = min_memory_mb + memory_noise * self.data_mb
+        rows = []
+        for name, current in self.results.items():
+            previous = baseline["results"].get(name)
+            if previous is None:
+                continue
+            memory, previous_memory = current["rss_growth_mb"], previous.get("rss_growth_mb")
+            time_ratio = current["seconds"] / previous["seconds"] if previous["seconds"] else np.nan
+            memory_ratio = memory / previous_memory if memory is not None and previous_memory else np.nan
+            slower = current["seconds"] > previous["seconds"] * (1 + tolerance) and current["seconds"] - previous["seconds"] > min_seconds
+            larger = (memory is not None and previous_memory is not None
+                      and memory > previous_memory * (1 + tolerance) and memory - previous_memory > memory_floor)
+            rows.append({
+                "benchmark": name,
+                "baseline_seconds": previous["seconds"],
+                "seconds": current["seconds"],
+                "time_ratio": time_ratio,
+                "baseline_rss_growth_mb": previous_memory,
+                "rss_growth_mb": memory,
+                "memory_ratio": memory_ratio,
+                "regression": bool(slower or larger),
+            })
+        return pd.DataFrame(rows).set_index("benchmark") if rows else pd.DataFrame()
+
+
+class _RssSampler(threading.Thread):
+    """
+    Background thread recording the peak resident set size of this process while a benchmark runs.
+    """
+    def __init__(self, interval=0.005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = _current_rss()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, _current_rss())
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, _current_rss())
+        return self.peak
+
+
+def _current_rss():
+    """
+    Current resident set size in bytes, or the process peak where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if platform.system() == "Darwin" else peak * 1024
+
+
+def _measure(func):
+    """
+    Run func once and return its wall time and peak resident memory above what was resident at the start.
+    """
+    sampler = _RssSampler()
+    baseline = sampler.peak
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        func()
+    finally:
+        seconds = time.perf_counter() - start
+        peak = sampler.stop()
+    return {"seconds": seconds, "rss_growth_mb": max(peak - baseline, 0) / 1024 ** 2}
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the EDA classes on synthetic loan payments data.")
+    parser.add_argument("--rows", type=float, default=1e5, help="Number of synthetic rows, e.g. 1e6.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark; the fastest time and median memory growth are reported.")
+    parser.add_argument("--only", nargs="*", help="Run only benchmarks whose name contains one of these strings.")
+    parser.add_argument("--table", help="Database table to benchmark extraction from, using credentials.yaml.")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to save the results to.")
+    parser.add_argument("--label", help="Name of the version benchmarked. Defaults to the current git commit.")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative slowdown flagged as a regression.")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Slowdown in seconds never flagged as a regression.")
+    parser.add_argument("--min-memory-mb", type=float, default=5.0, help="Memory growth in MB never flagged as a regression.")
+    parser.add_argument("--memory-noise", type=float, default=0.25,
+                        help="Fraction of the synthetic data's size added to the memory noise floor.")
+    parser.add_argument("--import-budget", type=float, default=0.25, help="Maximum package import time in seconds.")
+    arguments = parser.parse_args()
+
+    suite = BenchmarkSuite(arguments.rows, arguments.seed, arguments.repeat, arguments.table)
+    imports_ok = suite.check_imports(arguments.import_budget)
+    suite.run(arguments.only)
+    suite.save(arguments.output, arguments.label)
+    regressions = False
+    if arguments.compare:
+        comparison = suite.compare(arguments.compare, arguments.tolerance, arguments.min_seconds, arguments.min_memory_mb,
+                                   arguments.memory_noise)
+        print(comparison.to_string())
+        regressions = bool(len(comparison) and comparison["regression"].any())
+    if regressions or not imports_ok:
+        raise SystemExit(1)
@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+
+from loan_analytics import _month_index, _term_months
+
+
+class CashFlowProjector:
+    """
+    A class for projecting the remaining month-by-month payments of every loan in a portfolio.
+
+    Each loan is amortised from its outstanding principal (out_prncp), monthly interest rate
+    (int_rate / 1200) and instalment over the months left of its term, counted from
+    last_payment_date. Months are stepped one at a time across all loans at once, so the cost
+    is a few array operations per month of the longest remaining term rather than a loop per loan.
+    Loans without a term are given the number of payments that clears their balance at their
+    instalment. Open loans that still cannot be projected (no interest rate, or no term and an
+    instalment that does not cover the interest) are left out and flagged in excluded.
+    The schedule can be returned as a 2-D array (loans by months ahead) or reduced to portfolio
+    totals month by month without ever holding the full array.
+
+    Scenarios mark loans as charged off from the start of the projection: they make no further
+    payments and a recovery_rate fraction of their outstanding principal is recovered in the first month.
+
+    Attributes:
+        df (pd.DataFrame): The loan payments DataFrame.
+        balance (np.ndarray): Outstanding principal per loan.
+        rate (np.ndarray): Monthly interest rate per loan.
+        instalment (np.ndarray): Monthly instalment per loan.
+        remaining (np.ndarray): Number of payments left per loan.
+        excluded (np.ndarray): Boolean mask of open loans left out of the projection.
+        start (np.ndarray): Month index (year * 12 + month) of the first projected payment per loan.
+
+    Methods:
+        schedule(component="payment", charge_off=None, dtype=np.float64): Get the projected schedule as a 2-D array.
+        monthly_totals(charge_off=None, recovery_rate=0.0, calendar=False): Get portfolio totals per month.
+        projected_revenue(charge_off=None, recovery_rate=0.0): Get the total projected revenue.
+        scenarios(scenarios, recovery_rate=0.0): Compare the projected revenue of several scenarios.
+    """
+    COMPONENTS = ("payment", "interest", "principal", "balance")
+
+    def __init__(self, df):
+        self.df = df
+        term = _term_months(df["term"])
+        issued = _month_index(df["issue_date"])
+        last_paid = _month_index(df["last_payment_date"])
+        last_paid = np.where(np.isnan(last_paid), issued, last_paid)
+        status = df["loan_status"].astype(str)
+        closed = status.str.contains("Charged Off|Fully Paid", regex=True).to_numpy()
+
+        balance = np.where(closed, 0.0, np.nan_to_num(df["out_prncp"].to_numpy(dtype=float, na_value=np.nan)))
+        rate = df["int_rate"].to_numpy(dtype=float, na_value=np.nan) / 1200
+        instalment = df["instalment"].to_numpy(dtype=float, na_value=np.nan)
+        remaining = term - (last_paid - issued)
+        # Without a term, the payments left follow from the annuity formula n = -ln(1 - r·B/I) / ln(1 + r).
+        with np.errstate(divide='ignore', invalid='ignore'):
+            implied = np.where(
+                rate > 0,
+                -np.log(1 - rate * balance / instalment) / np.log1p(rate),
+                balance / instalment
+            )
+        implied = np.where(np.isfinite(implied) & (implied >= 0), np.ceil(np.round(implied, 6)), np.nan)
+        remaining = np.where(np.isnan(term), implied, remaining)
+        self.excluded = (balance > 0) & (np.isnan(rate) | np.isnan(remaining))
+
+        self.balance = np.where(self.excluded, 0.0, balance)
+        self.rate = np.nan_to_num(rate)
+        self.remaining = np.clip(np.nan_to_num(remaining), 0, None).astype(np.int64)
+        self.remaining[(self.balance > 0) & (self.remaining == 0)] = 1
+        self.start = np.nan_to_num(last_paid) + 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            annuity = np.where(
+                self.rate > 0,
+                self.balance * self.rate / (1 - (1 + self.rate) ** -np.maximum(self.remaining, 1)),
+                self.balance / np.maximum(self.remaining, 1)
+            )
+        self.instalment = np.where(np.isnan(instalment), annuity, instalment)
+
+    def _mask(self, charge_off):
+        """
+        Boolean mask of the loans charged off by a scenario.
+
+        charge_off may be None, a loan_status substring such as 'Late', a list of substrings or a boolean array.
+        """
+        if charge_off is None:
+            return np.zeros(len(self.balance), dtype=bool)
+        if isinstance(charge_off, str):
+            charge_off = [charge_off]
+        if isinstance(charge_off, (list, tuple)):
+            status = self.df["loan_status"].astype(str)
+            return np.logical_or.reduce([status.str.contains(value, regex=False).to_numpy() for value in charge_off])
+        return np.asarray(charge_off, dtype=bool)
+
+    def _months(self, charge_off=None):
+        """
+        Yield (month ahead, payment, interest, principal, balance) arrays across all loans, one month at a time.
+        """
+        balance = np.where(self._mask(charge_off), 0.0, self.balance)
+        horizon = int(self.remaining[balance > 0].max(initial=0))
+        for month in range(1, horizon + 1):
+            active = (balance > 0) & (month <= self.remaining)
+            interest = np.where(active, balance * self.rate, 0.0)
+            owed = balance + interest
+            payment = np.where(active, np.where(month == self.remaining, owed, np.minimum(self.instalment, owed)), 0.0)
+            principal = payment - interest
+            balance = np.where(active, owed - payment, balance)
+            yield month, payment, interest, principal, balance
+
+    def schedule(self, component="payment", charge_off=None, dtype=np.float64):
+        """
+        Get the projected schedule as a 2-D array.
+
+        Args:
+            component (str): 'payment', 'interest', 'principal' or 'balance' (after each month's payment).
+            charge_off (optional): Loans charged off by the scenario, see monthly_totals().
+            dtype (np.dtype): Array dtype; float32 halves the memory of large portfolios.
+
+        Returns:
+            np.ndarray: Array of shape (loans, months ahead); column k is month k + 1 after each loan's last payment.
+        """
+        if component not in self.COMPONENTS:
+            raise ValueError(f"Unknown component: {component}")
+        position = self.COMPONENTS.index(component) + 1
+        columns = [values[position].astype(dtype) for values in self._months(charge_off)]
+        if not columns:
+            return np.zeros((len(self.balance), 0), dtype=dtype)
+        return np.column_stack(columns)
+
+    def monthly_totals(self, charge_off=None, recovery_rate=0.0, calendar=False):
+        """
+        Get portfolio totals per month, aggregated as each month is projected.
+
+        Args:
+            charge_off (optional): Loans charged off at the start of the projection: a loan_status
+                substring such as 'Late', a list of substrings or a boolean array. Defaults to none.
+            recovery_rate (float): Fraction of the charged off loans' outstanding principal recovered in the first month.
+            calendar (bool): If True, index by calendar month instead of months ahead of each loan's last payment.
+
+        Returns:
+            pd.DataFrame: Payment, interest, principal and recoveries per month.
+        """
+        charged_off = self._mask(charge_off)
+        recoveries = np.where(charged_off, self.balance * recovery_rate, 0.0)
+        if not calendar:
+            rows = [
+                (month, payment.sum(), interest.sum(), principal.sum())
+                for month, payment, interest, principal, _ in self._months(charged_off)
+            ]
+            totals = pd.DataFrame(rows, columns=["month", "payment", "interest", "principal"]).set_index("month")
+            totals["recoveries"] = 0.0
+            if len(totals):
+                totals.loc[1, "recoveries"] = recoveries.sum()
+            return totals
+
+        projected = (self.balance > 0) & ~charged_off
+        first = int(self.start[projected].min(initial=self.start.max(initial=0)))
+        offset = np.clip(self.start - first, 0, None).astype(np.int64)
+        size = int(offset.max(initial=0)) + int(self.remaining.max(initial=0)) + 1
+        totals = np.zeros((size, 4))
+        totals[:, 3] = np.bincount(offset, weights=recoveries, minlength=size)
+        for month, payment, interest, principal, _ in self._months(charged_off):
+            index = offset + month - 1
+            totals[:, 0] += np.bincount(index, weights=payment, minlength=size)
+            totals[:, 1] += np.bincount(index, weights=interest, minlength=size)
+            totals[:, 2] += np.bincount(index, weights=principal, minlength=size)
+        used = np.flatnonzero(totals.any(axis=1))
+        totals = totals[:used[-1] + 1 if len(used) else 0]
+        periods = pd.period_range(pd.Period(year=(first - 1) // 12, month=(first - 1) % 12 + 1, freq="M"), periods=len(totals))
+        return pd.DataFrame(totals, index=periods, columns=["payment", "interest", "principal", "recoveries"])
+
+    def projected_revenue(self, charge_off=None, recovery_rate=0.0):
+        """
+        Get the total projected revenue: every remaining payment plus recoveries.
+
+        Args:
+            charge_off (optional): Loans charged off by the scenario, see monthly_totals().
+            recovery_rate (float): Fraction of the charged off loans' outstanding principal recovered.
+
+        Returns:
+            float: Projected revenue of the portfolio.
+        """
+        charged_off = self._mask(charge_off)
+        revenue = np.where(charged_off, self.balance * recovery_rate, 0.0).sum()
+        for _, payment, _, _, _ in self._months(charged_off):
+            revenue += payment.sum()
+        return float(revenue)
+
+    def scenarios(self, scenarios, recovery_rate=0.0):
+        """
+        Compare the projected revenue of several scenarios.
+
+        Args:
+            scenarios (dict): Scenario name to charge_off value, e.g. {'baseline': None, 'late charged off': 'Late'}.
+            recovery_rate (float): Fraction of the charged off loans' outstanding principal recovered.
+
+        Returns:
+            pd.DataFrame: Projected revenue per scenario and its change from the first scenario.
+        """
+        revenue = pd.Series(
+            {name: self.projected_revenue(charge_off, recovery_rate) for name, charge_off in scenarios.items()},
+            name="projected_revenue"
+        )
+        return pd.DataFrame({"projected_revenue": revenue, "change": revenue - revenue.iloc[0]})
@@ -0,0 +1,110 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def map_columns(func, df, columns, executor=None, max_workers=None):
+    """
+    Apply a function to the values of several columns, optionally in parallel.
+
+    With executor='process', each column is copied once into a shared memory block and
+    worker processes read it in place, so the DataFrame itself is never pickled.
+
+    Args:
+        func (callable): Module-level function taking a 1-D float array and returning a small result.
+        df (pd.DataFrame): DataFrame holding the columns.
+        columns (list): List of column names to process.
+        executor (str, optional): 'thread', 'process' or None to run serially.
+        max_workers (int, optional): Maximum number of workers. Defaults to the executor's default.
+
+    Returns:
+        dict: Result of func for each column.
+    """
+    if executor is None:
+        return {column: func(df[column].to_numpy(dtype=float)) for column in columns}
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(func, [df[column].to_numpy(dtype=float) for column in columns])
+            return dict(zip(columns, results))
+    if executor == "process":
+        return _run_in_processes(func, df, columns, max_workers, output=False)[1]
+    raise ValueError(f"Unknown executor: {executor}")
+
+
+def transform_columns(func, df, columns, executor=None, max_workers=None):
+    """
+    Apply a column transformation to several columns, optionally in parallel.
+
+    With executor='process', both the input columns and the transformed output are held in
+    shared memory blocks, so neither the DataFrame nor the transformed arrays are pickled.
+
+    Args:
+        func (callable): Module-level function taking a 1-D float array and returning
+            (transformed array of the same length, extra result such as a fitted parameter).
+        df (pd.DataFrame): DataFrame holding the columns.
+        columns (list): List of column names to transform.
+        executor (str, optional): 'thread', 'process' or None to run serially.
+        max_workers (int, optional): Maximum number of workers. Defaults to the executor's default.
+
+    Returns:
+        tuple: Dict of transformed arrays and dict of extra results, both keyed by column.
+    """
+    if executor == "process":
+        return _run_in_processes(func, df, columns, max_workers, output=True)
+    results = map_columns(func, df, columns, executor, max_workers)
+    transformed = {column: result[0] for column, result in results.items()}
+    extras = {column: result[1] for column, result in results.items()}
+    return transformed, extras
+
+
+def _run_in_processes(func, df, columns, max_workers, output):
+    """
+    Run func over columns in a process pool, passing column buffers through shared memory.
+    """
+    blocks = []
+    outputs = {}
+    try:
+        tasks = []
+        for column in columns:
+            values = df[column].to_numpy(dtype=float)
+            source = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            blocks.append(source)
+            np.ndarray(values.shape, dtype=float, buffer=source.buf)[:] = values
+            target_name = None
+            if output:
+                target = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+                blocks.append(target)
+                target_name = target.name
+                outputs[column] = np.ndarray(values.shape, dtype=float, buffer=target.buf)
+            tasks.append((func, source.name, target_name, len(values)))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = dict(zip(columns, pool.map(_run_shared_task, tasks)))
+        transformed = {column: array.copy() for column, array in outputs.items()}
+        return transformed, results
+    finally:
+        outputs.clear()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _run_shared_task(task):
+    """
+    Worker entry point: attach to the shared column buffer, run the function and write any output in place.
+    """
+    func, source_name, target_name, length = task
+    source = shared_memory.SharedMemory(name=source_name)
+    try:
+        result = func(np.ndarray((length,), dtype=float, buffer=source.buf))
+        if target_name is None:
+            return result
+        transformed, extra = result
+        target = shared_memory.SharedMemory(name=target_name)
+        try:
+            np.ndarray((length,), dtype=float, buffer=target.buf)[:] = transformed
+        finally:
+            target.close()
+        return extra
+    finally:
+        source.close()
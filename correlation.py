@@ -0,0 +1,247 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from summary_statistics import QuantileSketch
+
+
+class CovarianceAccumulator:
+    """
+    A mergeable accumulator of pairwise-complete co-moments for Pearson correlation.
+
+    For every pair of columns it keeps the number of rows where both are present and the
+    sums of x, x squared and x * y over those rows, after subtracting a fixed shift per column
+    for numerical stability. Chunks are added with a few matrix products and accumulators
+    merge by addition, so the result matches pd.DataFrame.corr() on the full data.
+
+    Attributes:
+        columns (list): Accumulated column names.
+        shift (np.ndarray): Value subtracted from each column before accumulating.
+        n (np.ndarray): Pairwise count of rows where both columns are present.
+        sum_x (np.ndarray): sum_x[i, j] is the sum of column i over rows where i and j are present.
+        sum_xx (np.ndarray): sum_xx[i, j] is the sum of column i squared over rows where i and j are present.
+        sum_xy (np.ndarray): Sum of the products of columns i and j over rows where both are present.
+
+    Methods:
+        update(values): Add a 2-D array of values (rows by columns, NaN for missing).
+        merge(other): Combine with another accumulator over the same columns and shift.
+        correlation(): Get the Pearson correlation matrix as a DataFrame.
+    """
+    def __init__(self, columns, shift):
+        k = len(columns)
+        self.columns = list(columns)
+        self.shift = np.asarray(shift, dtype=float)
+        self.n = np.zeros((k, k))
+        self.sum_x = np.zeros((k, k))
+        self.sum_xx = np.zeros((k, k))
+        self.sum_xy = np.zeros((k, k))
+
+    def update(self, values):
+        """
+        Add a 2-D array of values (rows by columns, NaN for missing).
+
+        Args:
+            values (np.ndarray): Float array with one column per accumulated column.
+        """
+        present = (~np.isnan(values)).astype(float)
+        shifted = np.where(present > 0, values - self.shift, 0.0)
+        self.n += present.T @ present
+        self.sum_x += shifted.T @ present
+        self.sum_xx += (shifted ** 2).T @ present
+        self.sum_xy += shifted.T @ shifted
+        return self
+
+    def merge(self, other):
+        """
+        Combine with another accumulator over the same columns and shift.
+
+        Args:
+            other (CovarianceAccumulator): Accumulator built over different rows.
+        """
+        self.n += other.n
+        self.sum_x += other.sum_x
+        self.sum_xx += other.sum_xx
+        self.sum_xy += other.sum_xy
+        return self
+
+    def correlation(self):
+        """
+        Get the Pearson correlation matrix as a DataFrame.
+
+        Returns:
+            pd.DataFrame: Pairwise-complete correlation between every pair of columns.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = self.sum_xy - self.sum_x * self.sum_x.T / self.n
+            variance = self.sum_xx - self.sum_x ** 2 / self.n
+            correlation = covariance / np.sqrt(variance * variance.T)
+        correlation = np.clip(correlation, -1, 1)
+        np.fill_diagonal(correlation, np.where(np.diag(variance) > 0, 1.0, np.nan))
+        return pd.DataFrame(correlation, index=self.columns, columns=self.columns)
+
+
+class CorrelationEngine:
+    """
+    A class for computing Pearson or Spearman correlation matrices in blocks, in parallel and out of core.
+
+    Data is processed as row blocks (of an in-memory DataFrame) or chunks (of an iterator), each
+    block is reduced to a CovarianceAccumulator on a thread pool, and the accumulators are merged.
+    Pearson results are exact. Spearman ranks each column over all of its non-missing values,
+    exactly for in-memory DataFrames and from quantile sketches for chunks, which then needs a
+    second pass and so a list of chunks or a callable returning a fresh iterator. The sketches
+    bound the relative error of values, not of ranks: values within about 2% of each other share
+    a bucket and so a rank. Chunked Spearman is close for columns spread over several orders of
+    magnitude, but can be far off for columns packed into a narrow relative range, such as large
+    sequential ids; compute those in memory or with approximate().
+
+    Attributes:
+        columns (list, optional): Columns to correlate. Defaults to the numeric columns of the data.
+        method (str): 'pearson' or 'spearman'.
+        max_workers (int, optional): Maximum number of threads reducing blocks in parallel.
+        block_size (int): Number of rows per block for in-memory DataFrames.
+
+    Methods:
+        compute(data): Compute the correlation matrix.
+        approximate(data, sample_size=10000, confidence=0.95, random_state=None): Estimate the correlation matrix from a row sample with confidence bounds.
+    """
+    def __init__(self, columns=None, method="pearson", max_workers=None, block_size=100000):
+        if method not in ("pearson", "spearman"):
+            raise ValueError(f"Unknown correlation method: {method}")
+        self.columns = list(columns) if columns else None
+        self.method = method
+        self.max_workers = max_workers
+        self.block_size = block_size
+
+    def compute(self, data):
+        """
+        Compute the correlation matrix.
+
+        Args:
+            data (pd.DataFrame, list or callable): A DataFrame, an iterable of DataFrame chunks, or a
+                callable returning a fresh iterator of chunks.
+
+        Returns:
+            pd.DataFrame: Correlation matrix.
+        """
+        if isinstance(data, pd.DataFrame):
+            columns = self.columns or list(data.select_dtypes('number').columns)
+            frame = data[columns]
+            if self.method == "spearman":
+                frame = frame.rank()
+            blocks = (frame.iloc[start:start + self.block_size] for start in range(0, len(frame), self.block_size))
+            return self._reduce(blocks, columns)
+
+        chunks = data
+        if self.method == "spearman":
+            if not callable(chunks) and iter(chunks) is chunks:
+                raise ValueError("Spearman correlation over chunks needs two passes; pass a list of chunks or a callable returning an iterator.")
+            first = next(self._iterate(chunks))
+            columns = self.columns or list(first.select_dtypes('number').columns)
+            sketches = [QuantileSketch() for _ in columns]
+            for chunk in self._iterate(chunks):
+                values = chunk[columns].to_numpy(dtype=float, na_value=np.nan)
+                for position, sketch in enumerate(sketches):
+                    sketch.update(values[:, position][~np.isnan(values[:, position])])
+            ranked = (
+                pd.DataFrame(
+                    np.column_stack([
+                        sketch.rank(chunk[column].to_numpy(dtype=float, na_value=np.nan))
+                        for column, sketch in zip(columns, sketches)
+                    ]),
+                    columns=columns
+                )
+                for chunk in self._iterate(chunks)
+            )
+            return self._reduce(ranked, columns)
+        return self._reduce(self._iterate(chunks), self.columns)
+
+    def approximate(self, data, sample_size=10000, confidence=0.95, random_state=None):
+        """
+        Estimate the correlation matrix from a random sample of rows, with confidence bounds.
+
+        Bounds use the Fisher z-transformation with the pairwise number of sampled rows.
+
+        Args:
+            data (pd.DataFrame or iterable): A DataFrame or an iterable of DataFrame chunks.
+            sample_size (int): Number of rows to sample (reservoir sampling for chunks).
+            confidence (float): Confidence level of the bounds.
+            random_state (int, optional): Seed for the sample.
+
+        Returns:
+            tuple: Estimated correlation matrix, and lower and upper confidence bounds, as DataFrames.
+        """
+        from scipy.stats import norm
+        rng = np.random.default_rng(random_state)
+        if isinstance(data, pd.DataFrame):
+            sample = data.sample(n=min(sample_size, len(data)), random_state=random_state) if len(data) > sample_size else data
+        else:
+            sample = self._reservoir_sample(self._iterate(data), sample_size, rng)
+        columns = self.columns or list(sample.select_dtypes('number').columns)
+        engine = CorrelationEngine(columns, self.method, self.max_workers, self.block_size)
+        estimate = engine.compute(sample)
+        present = (~sample[columns].isnull()).to_numpy(dtype=float)
+        pairs = present.T @ present
+        z = norm.ppf(0.5 + confidence / 2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            half_width = z / np.sqrt(pairs - 3)
+            fisher = np.arctanh(np.clip(estimate.to_numpy(), -0.999999, 0.999999))
+        lower, upper = np.tanh(fisher - half_width), np.tanh(fisher + half_width)
+        np.fill_diagonal(lower, np.diag(estimate))
+        np.fill_diagonal(upper, np.diag(estimate))
+        lower = pd.DataFrame(lower, index=columns, columns=columns)
+        upper = pd.DataFrame(upper, index=columns, columns=columns)
+        return estimate, lower, upper
+
+    def _reduce(self, blocks, columns):
+        """
+        Reduce blocks to one merged CovarianceAccumulator on a thread pool and return its correlation matrix.
+        """
+        blocks = iter(blocks)
+        first = next(blocks, None)
+        if first is None:
+            return pd.DataFrame(index=columns, columns=columns, dtype=float)
+        columns = columns or list(first.select_dtypes('number').columns)
+        shift = np.nan_to_num(first[columns].mean().to_numpy(dtype=float))
+
+        def reduce_block(block):
+            return CovarianceAccumulator(columns, shift).update(block[columns].to_numpy(dtype=float, na_value=np.nan))
+
+        total = reduce_block(first)
+        max_pending = 2 * (self.max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = []
+            for block in blocks:
+                pending.append(pool.submit(reduce_block, block))
+                if len(pending) >= max_pending:
+                    total.merge(pending.pop(0).result())
+            for future in pending:
+                total.merge(future.result())
+        return total.correlation()
+
+    @staticmethod
+    def _iterate(chunks):
+        return chunks() if callable(chunks) else iter(chunks)
+
+    @staticmethod
+    def _reservoir_sample(chunks, sample_size, rng):
+        """
+        Draw a uniform random sample of rows from chunks with reservoir sampling.
+        """
+        reservoir = None
+        seen = 0
+        for chunk in chunks:
+            if reservoir is None:
+                reservoir = chunk.iloc[:0]
+            positions = np.arange(seen, seen + len(chunk))
+            seen += len(chunk)
+            fill = max(sample_size - len(reservoir), 0)
+            reservoir = pd.concat([reservoir, chunk.iloc[:fill]], ignore_index=True)
+            replace_at = rng.integers(0, positions[fill:] + 1)
+            accepted = np.flatnonzero(replace_at < sample_size)
+            if len(accepted):
+                # Later rows replace earlier ones drawn for the same slot.
+                slots = dict(zip(replace_at[accepted].tolist(), (fill + accepted).tolist()))
+                reservoir.iloc[list(slots)] = chunk.iloc[list(slots.values())].to_numpy()
+        return reservoir
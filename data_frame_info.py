@@ -1,15 +1,29 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import boxcox, skew
-import matplotlib.pyplot as plt
-import seaborn as sns
+from column_executor import map_columns
+from instrumentation import instrumented, status
+from summary_statistics import StatisticsAccumulator
 
+@instrumented
 class DataFrameInfo:
     """
     A class for providing insights and information about a Pandas DataFrame.
 
+    The DataFrame can also be given as an iterator of chunks (CSV chunks, Parquet row groups
+    or database cursor batches). The statistics methods then profile the chunks out of core
+    with a StatisticsAccumulator, so quantiles and distinct counts are approximate. Chunk dtypes
+    are inferred from the first chunk unless dtypes is given; columns that turn out not to be
+    numeric in a later chunk are described as object and lose their numeric statistics.
+
     Attributes:
-        df (pd.DataFrame): The input Pandas DataFrame.
+        df (pd.DataFrame): The input Pandas DataFrame, or None when profiling chunks.
+        chunks (iterator): Iterator of DataFrame chunks still to be profiled, or None.
+        progress_callback (callable, optional): Called as progress_callback(chunks_processed, rows_processed) after each chunk.
+        dtypes (dict, optional): Mapping of column names to dtypes applied to every chunk.
+        statistics (StatisticsAccumulator): Statistics accumulated from the chunks processed so far.
+        executor (str, optional): 'thread' or 'process' to compute per-column skewness and Box-Cox fits in parallel, or None to run serially.
+        max_workers (int, optional): Maximum number of parallel workers.
+        cache (ResultCache, optional): Cache reusing statistics and Box-Cox comparisons computed on unchanged data.
 
     Methods:
         describe_columns(columns=None): Get data types of specified columns or all columns.
@@ -18,10 +32,25 @@ class DataFrameInfo:
         print_shape(): Print the shape of the DataFrame.
         count_null_values(columns=None): Count null values and calculate the percentage of null values in specified columns or all columns.
         data_skew(columns=None): Calculate skewness of specified columns or all columns.
-        compare_transformations(column_to_transform): Compare the skewness and histograms of original, Box-Cox transformed, and log-transformed values of a column.
+        compare_transformations(column_to_transform, save_path=None): Compare the skewness and histograms of original, Box-Cox transformed, and log-transformed values of a column.
+        profile(columns=None, quantiles=(0.25, 0.5, 0.75)): Compute count, nulls, mean, variance, skew, min/max, approximate quantiles and distinct counts in one pass.
+        iter_profile(columns=None, quantiles=(0.25, 0.5, 0.75)): Profile the remaining chunks, yielding the running statistics after each one.
     """
-    def __init__(self, df):
-        self.df = df
+    def __init__(self, df, progress_callback=None, executor=None, max_workers=None, cache=None, dtypes=None):
+        if isinstance(df, pd.DataFrame):
+            self.df = df
+            self.chunks = None
+        else:
+            self.df = None
+            self.chunks = iter(df)
+        self.progress_callback = progress_callback
+        self.dtypes = dtypes
+        self.executor = executor
+        self.max_workers = max_workers
+        self.cache = cache
+        self.statistics = None
+        self._dtypes = None
+        self._chunks_processed = 0
 
     def describe_columns(self, columns=None):
         """
@@ -32,6 +61,10 @@ class DataFrameInfo:
         Returns:
             pd.Series: Data types of specified columns or all columns.
         """
+        if self.df is None:
+            if self._dtypes is None:
+                next(self._accumulate(), None)
+            return self._dtypes[columns] if columns else self._dtypes
         if columns:
             return self.df[columns].dtypes
         else:
@@ -46,10 +79,23 @@ class DataFrameInfo:
         Returns:
             pd.DataFrame: Statistical values for specified columns or all columns.
         """
+        if self.df is None:
+            summary = self._chunk_summary(columns)
+            numeric = [column for column in summary.index if column in self.statistics.numeric_columns]
+            return summary.loc[numeric, ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']].T.astype(float)
         if columns:
-            return self.df[columns].describe()
+            return self._cached('extract_statistical_values', columns, lambda: self.df[columns].describe())
         else:
-            return self.df.describe()
+            # describe() also summarises datetime columns, or text columns when there are no numeric ones.
+            return self._cached('extract_statistical_values', None, self.df.describe)
+
+    def _cached(self, method, columns, compute, *args):
+        """
+        Compute a result through the result cache, if one is configured.
+        """
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(method, self.df, columns, compute, *args)
 
     def count_distinct_values(self, columns=None):
         """
@@ -60,7 +106,9 @@ class DataFrameInfo:
         Returns:
             pd.Series: Counts of distinct values for specified columns or all columns (excluding columns with only one unique value).
         """
-        if columns:
+        if self.df is None:
+            distinct_counts = self._chunk_summary(columns)['distinct']
+        elif columns:
             distinct_counts = self.df[columns].nunique()
         else:
             distinct_counts = self.df.nunique()
@@ -70,6 +118,9 @@ class DataFrameInfo:
         """
         Print the shape of the DataFrame.
         """
+        if self.df is None:
+            statistics = self._statistics()
+            return (statistics.rows, len(statistics.columns))
         return self.df.shape
 
     def count_null_values(self, columns=None):
@@ -81,17 +132,96 @@ class DataFrameInfo:
         Returns:
             pd.DataFrame: Null counts and percentage null for specified columns or all columns.
         """
-        if columns:
+        if self.df is None:
+            null_counts = self._chunk_summary(columns)['null_count']
+            row_count = self.statistics.rows
+        elif columns:
             null_counts = self.df[columns].isnull().sum()
+            row_count = len(self.df)
         else:
             null_counts = self.df.isnull().sum()
-        percentage_null = (null_counts / len(self.df)) * 100
+            row_count = len(self.df)
+        percentage_null = (null_counts / row_count) * 100
         null_info = pd.DataFrame({
             'Null Count': null_counts,
             'Percentage Null': percentage_null
         })
         return null_info
     
+    def profile(self, columns=None, quantiles=(0.25, 0.5, 0.75)):
+        """
+        Compute summary statistics for specified columns or all columns in a single pass.
+
+        Uses a mergeable StatisticsAccumulator: moments, nulls, min and max are exact,
+        quantiles are within 1% relative error and distinct counts are HyperLogLog estimates.
+
+        Args:
+            columns (list, optional): List of column names. If None, profiles all columns.
+            quantiles (tuple): Quantiles to estimate for numeric columns.
+        Returns:
+            pd.DataFrame: One row of statistics per column.
+        """
+        if self.df is None:
+            return self._chunk_summary(columns, quantiles)
+        data = self.df[columns] if columns else self.df
+        return StatisticsAccumulator().update(data).summary(quantiles)
+
+    def iter_profile(self, columns=None, quantiles=(0.25, 0.5, 0.75)):
+        """
+        Profile the remaining chunks, yielding the running statistics after each one.
+
+        Args:
+            columns (list, optional): List of column names. If None, yields statistics for all columns.
+            quantiles (tuple): Quantiles to estimate for numeric columns.
+        Yields:
+            pd.DataFrame: Statistics for the chunks processed so far, one row per column.
+        """
+        if self.df is not None:
+            yield self.profile(columns, quantiles)
+            return
+        for statistics in self._accumulate():
+            summary = statistics.summary(quantiles)
+            yield summary.loc[columns] if columns else summary
+
+    def _accumulate(self):
+        """
+        Add the remaining chunks to the accumulated statistics, yielding them after each chunk.
+        """
+        if self.statistics is None:
+            self.statistics = StatisticsAccumulator(dtypes=self.dtypes)
+        for chunk in self.chunks:
+            numeric_columns = self.statistics.numeric_columns
+            self.statistics.update(chunk)
+            if self._dtypes is None:
+                self._dtypes = chunk.dtypes.copy()
+                if self.dtypes:
+                    self._dtypes.update(pd.Series({
+                        column: pd.api.types.pandas_dtype(dtype) for column, dtype in self.dtypes.items()
+                        if column in self._dtypes.index
+                    }, dtype=object))
+            elif numeric_columns != self.statistics.numeric_columns:
+                drifted = [column for column in numeric_columns if column not in self.statistics.numeric_columns]
+                self._dtypes[drifted] = np.dtype(object)
+            self._chunks_processed += 1
+            if self.progress_callback:
+                self.progress_callback(self._chunks_processed, self.statistics.rows)
+            yield self.statistics
+
+    def _statistics(self):
+        """
+        Profile all remaining chunks and return the accumulated statistics.
+        """
+        for _ in self._accumulate():
+            pass
+        return self.statistics
+
+    def _chunk_summary(self, columns=None, quantiles=(0.25, 0.5, 0.75)):
+        """
+        Get the accumulated statistics of all chunks for specified columns or all columns.
+        """
+        summary = self._statistics().summary(quantiles)
+        return summary.loc[columns] if columns else summary
+
     def data_skew(self, columns=None):
         """
         Calculate skewness of specified columns or all columns.
@@ -101,27 +231,51 @@ class DataFrameInfo:
         Returns:
             pd.Series: Skewness values for specified columns or all columns.
         """
-        return self.df[columns].skew(axis = 0, skipna = True)
+        if self.df is None:
+            summary = self._chunk_summary(columns)
+            return summary.loc[[c for c in summary.index if c in self.statistics.numeric_columns], 'skew'].astype(float)
+        if self.executor:
+            columns = columns or list(self.df.select_dtypes('number').columns)
+            return self._cached(
+                'data_skew', columns,
+                lambda: pd.Series(map_columns(_column_skew, self.df, columns, self.executor, self.max_workers))
+            )
+        return self._cached('data_skew', columns, lambda: self.df[columns].skew(axis = 0, skipna = True))
     
 
-    def compare_transformations(self, column_to_transform):
+    def compare_transformations(self, column_to_transform, save_path=None):
         """
         Compare the skewness and histograms of original, Box-Cox transformed, and log-transformed values of a column.
 
+        A list of columns is compared one after another, with the Box-Cox fits and skewness
+        of all columns computed up front on the configured executor.
+
         Args:
-            column_to_transform (str): Name of the column to be transformed.
+            column_to_transform (str or list): Name of the column, or list of column names, to be transformed.
+            save_path (str, optional): File to save the figure to instead of showing it. Any '{column}'
+                in the path is replaced by the column name.
+        """
+        columns = [column_to_transform] if isinstance(column_to_transform, str) else list(column_to_transform)
+        results = self._cached(
+            'compare_transformations', columns,
+            lambda: map_columns(_transformation_skews, self.df, columns, self.executor, self.max_workers)
+        )
+        for column, result in results.items():
+            self._plot_transformations(column, *result, save_path=save_path)
+
+    def _plot_transformations(self, column_to_transform, lmbda, original_skew, boxcox_skew, log_skew, save_path=None):
+        """
+        Print the skewness and plot histograms of the original, Box-Cox transformed and log-transformed values of a column.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from scipy import special
         original_values = self.df[column_to_transform]
-        original_skew = skew(original_values)
-        boxcox_transformed_values, _ = boxcox(original_values)
-        boxcox_df = pd.DataFrame({f'Box-Cox Transformed {column_to_transform}': boxcox_transformed_values})
-        boxcox_skew = skew(boxcox_transformed_values)
+        boxcox_transformed_values = special.boxcox(original_values.to_numpy(dtype=float), lmbda)
         log_transformed_values = np.log1p(original_values)
-        log_df = pd.DataFrame({f'Log Transformed {column_to_transform}': log_transformed_values})
-        log_skew = skew(log_transformed_values)
-        print(f'Skewness - Original {column_to_transform}: {original_skew}')
-        print(f'Skewness - Box-Cox Transformed {column_to_transform}: {boxcox_skew}')
-        print(f'Skewness - Log Transformed {column_to_transform}: {log_skew}')
+        status(f'Skewness - Original {column_to_transform}: {original_skew}')
+        status(f'Skewness - Box-Cox Transformed {column_to_transform}: {boxcox_skew}')
+        status(f'Skewness - Log Transformed {column_to_transform}: {log_skew}')
         plt.figure(figsize=(12, 6))
         plt.subplot(1, 3, 1)
         sns.histplot(original_values, kde=True)
@@ -133,7 +287,28 @@ class DataFrameInfo:
         sns.histplot(log_transformed_values, kde=True)
         plt.title(f'Log Transformed {column_to_transform}')
         plt.tight_layout()
-        plt.show()
+        if save_path:
+            plt.savefig(save_path.replace('{column}', column_to_transform), bbox_inches='tight')
+            plt.close('all')
+        else:
+            plt.show()
+
+
+def _column_skew(values):
+    """
+    Bias-corrected skewness of a column, ignoring missing values, as returned by pd.Series.skew().
+    """
+    from scipy.stats import skew
+    return skew(values, bias=False, nan_policy='omit')
 
 
-    
\ No newline at end of file
+def _transformation_skews(values):
+    """
+    Fit a Box-Cox transformation to a column and compute the skewness of the original, Box-Cox and log-transformed values.
+
+    Returns:
+        tuple: Box-Cox lambda, original skew, Box-Cox skew and log skew.
+    """
+    from scipy.stats import boxcox, skew
+    boxcox_values, lmbda = boxcox(values)
+    return lmbda, skew(values), skew(boxcox_values), skew(np.log1p(values))
@@ -1,13 +1,26 @@
+import copy
+from functools import partial
+
 import pandas as pd
 import numpy as np
-from scipy.stats import boxcox, zscore
+import yaml
+
+from column_executor import map_columns, transform_columns
+from instrumentation import instrumented, status
+from outlier_detection import OutlierDetector
 
+@instrumented
 class DataTransform:
     """
     A class for performing various transformations on a Pandas DataFrame.
 
     Attributes:
         df (pd.DataFrame): The input Pandas DataFrame.
+        executor (str, optional): 'thread' or 'process' to run per-column Box-Cox fits and z-score masks in parallel, or None to run serially.
+        max_workers (int, optional): Maximum number of parallel workers.
+        cache (ResultCache, optional): Result cache whose entries for changed columns are invalidated after each transformation.
+        fitted_steps (list): Transformations applied so far as (operation, columns, params) tuples,
+            including fitted parameters such as Box-Cox lambdas, imputed values and z-score statistics.
 
     Methods:
         convert_dates_to_datetime(date_columns): Convert specified columns to datetime format.
@@ -17,11 +30,44 @@ class DataTransform:
         impute_mode(column_to_impute): Impute missing values in a column with its mode.
         impute_mean(column_to_impute): Impute missing values in a column with its mean.
         log_transform(column_to_transform): Apply a log transformation to a specified column.
-        boxcox_transform(column_to_transform): Apply a Box-Cox transformation to a specified column.
-        remove_outliers_zscore(column_to_transform, z_threshold=2): Remove outliers using z-score method.
+        boxcox_transform(column_to_transform): Apply a Box-Cox transformation to a specified column or list of columns.
+        remove_outliers_zscore(column_to_transform, z_threshold=2): Remove outliers using z-score method on a specified column or list of columns.
+        remove_outliers(columns_to_transform, method="zscore", threshold=None): Remove rows that are outliers in any of several columns using z-score, IQR or MAD bounds.
+        optimise_memory(category_threshold=0.5, date_columns=None, downcast_floats=False): Downcast numeric columns, convert low-cardinality text to categories and parse dates to reduce memory.
+        lazy(): Start a lazy pipeline that records transformations and runs them in one pass.
+        transform(dataframe): Apply the fitted transformations to a new DataFrame without refitting.
+        save_parameters(file_path="transform_parameters.yaml"): Save the fitted transformations to a YAML file.
+        load_parameters(file_path="transform_parameters.yaml"): Load fitted transformations from a YAML file.
     """
-    def __init__(self, dataframe):
+    def __init__(self, dataframe, executor=None, max_workers=None, cache=None):
         self.df = dataframe
+        self.executor = executor
+        self.max_workers = max_workers
+        self.cache = cache
+        self.fitted_steps = []
+
+    def _record_step(self, step):
+        """
+        Record an applied step in fitted_steps and invalidate cached results for the columns it changed.
+
+        Args:
+            step (tuple): The (operation, columns, params) step that was applied.
+        """
+        self.fitted_steps.append(step)
+        if self.cache is not None:
+            operation, columns, _ = step
+            if operation in ("drop_rows", "remove_outliers_zscore", "remove_outliers"):
+                columns = list(columns) + list(self.df.columns)
+            self.cache.invalidate(list(columns))
+
+    def lazy(self):
+        """
+        Start a lazy pipeline on the DataFrame.
+
+        Returns:
+            LazyDataTransform: Pipeline recording the same transformations as this class until collect() is called.
+        """
+        return LazyDataTransform(self)
 
     def convert_dates_to_datetime(self, date_columns):
         """
@@ -32,6 +78,7 @@ class DataTransform:
         """
         for column in date_columns:
             self.df[column] = pd.to_datetime(self.df[column], format='%b-%Y')
+        self._record_step(("convert_dates_to_datetime", tuple(date_columns), {}))
 
     def convert_categorical_columns(self, categorical_columns):
         """
@@ -41,6 +88,8 @@ class DataTransform:
             categorical_columns (list): List of column names to be converted to categorical data type.
         """
         self.df[categorical_columns] = self.df[categorical_columns].astype('category')
+        categories = {column: self.df[column].cat.categories.tolist() for column in categorical_columns}
+        self._record_step(("convert_categorical_columns", tuple(categorical_columns), {"categories": categories}))
 
     def drop_rows(self, dropped_rows):
         """
@@ -50,6 +99,7 @@ class DataTransform:
             dropped_rows (list): List of column names to check for missing values.
         """
         self.df = self.df.dropna(subset=dropped_rows)
+        self._record_step(("drop_rows", tuple(dropped_rows), {}))
 
     def drop_columns(self, columns_to_drop):
         """
@@ -59,6 +109,7 @@ class DataTransform:
             columns_to_drop (list): List of column names to be dropped from the DataFrame.
         """
         self.df = self.df.drop(columns=columns_to_drop)
+        self._record_step(("drop_columns", tuple(columns_to_drop), {}))
     
     def impute_mode(self, column_to_impute):
         """
@@ -67,7 +118,9 @@ class DataTransform:
         Args:
             column_to_impute (str): Name of the column to be imputed.
         """
-        self.df[column_to_impute].fillna(self.df[column_to_impute].mode()[0], inplace=True)
+        mode = self.df[column_to_impute].mode()[0]
+        self.df[column_to_impute] = self.df[column_to_impute].fillna(mode)
+        self._record_step(("impute_mode", (column_to_impute,), {"values": {column_to_impute: mode}}))
 
     def impute_mean(self, column_to_impute):
         """
@@ -76,7 +129,9 @@ class DataTransform:
         Args:
             column_to_impute (str): Name of the column to be imputed.
         """
-        self.df[column_to_impute].fillna(self.df[column_to_impute].mean(), inplace=True)
+        mean = self.df[column_to_impute].mean()
+        self.df[column_to_impute] = self.df[column_to_impute].fillna(mean)
+        self._record_step(("impute_mean", (column_to_impute,), {"values": {column_to_impute: mean}}))
 
     def log_transform(self, column_to_transform):
         """
@@ -86,27 +141,537 @@ class DataTransform:
             column_to_transform (str): Name of the column to be log-transformed.
         """
         self.df[column_to_transform] = np.log1p(self.df[column_to_transform])
+        self._record_step(("log_transform", (column_to_transform,), {}))
     
     def boxcox_transform(self, column_to_transform):
         """
         Apply a Box-Cox transformation to a specified column.
 
+        A list of columns is fitted column by column on the configured executor.
+
         Args:
-            column_to_transform (str): Name of the column to be Box-Cox transformed.
+            column_to_transform (str or list): Name of the column, or list of column names, to be Box-Cox transformed.
         """
-        original_values = self.df[column_to_transform]
-        transformed_values, lmbda = boxcox(original_values)
-        self.df[column_to_transform] = transformed_values
+        from scipy.stats import boxcox
+        columns = [column_to_transform] if isinstance(column_to_transform, str) else list(column_to_transform)
+        transformed_values, lmbdas = transform_columns(
+            boxcox, self.df, columns, executor=self.executor, max_workers=self.max_workers
+        )
+        for column in columns:
+            self.df[column] = transformed_values[column]
+        self._record_step(("boxcox_transform", tuple(columns), {"lmbda": lmbdas}))
 
     def remove_outliers_zscore(self, column_to_transform, z_threshold=2):
         """
         Remove outliers using z-score method.
 
+        For a list of columns, the z-scores of every column are computed on the same rows
+        (in parallel on the configured executor) and a row is removed if it is an outlier
+        in any of them.
+
         Args:
-            column_to_transform (str): Name of the column to be processed for outlier removal.
+            column_to_transform (str or list): Name of the column, or list of column names, to be processed for outlier removal.
             z_threshold (float): Z-score threshold beyond which values are considered outliers.
         """
-        z_scores = zscore(self.df[column_to_transform])
-        outliers = np.abs(z_scores) > z_threshold
+        columns = [column_to_transform] if isinstance(column_to_transform, str) else list(column_to_transform)
+        results = map_columns(
+            partial(_zscore_outliers, z_threshold=z_threshold), self.df, columns,
+            executor=self.executor, max_workers=self.max_workers
+        )
+        outliers = np.zeros(len(self.df), dtype=bool)
+        for column_outliers, _, _ in results.values():
+            outliers |= column_outliers
         self.df = self.df[~outliers]
- 
+        self._record_step((
+            "remove_outliers_zscore", tuple(columns),
+            {
+                "z_threshold": z_threshold,
+                "mean": {column: result[1] for column, result in results.items()},
+                "std": {column: result[2] for column, result in results.items()}
+            }
+        ))
+
+    def remove_outliers(self, columns_to_transform, method="zscore", threshold=None):
+        """
+        Remove rows that are outliers in any of several columns, using one combined mask.
+
+        Bounds for all columns are computed in one vectorized pass and the DataFrame is
+        filtered once at the end (see OutlierDetector for the methods and default thresholds).
+
+        Args:
+            columns_to_transform (list): List of column names to be processed for outlier removal.
+            method (str): 'zscore', 'iqr' or 'mad'.
+            threshold (float, optional): Multiplier applied to each column's spread. Defaults to the method's default.
+        Returns:
+            pd.Series: Number of values flagged as outliers per column.
+        """
+        detector = OutlierDetector(columns_to_transform, method, threshold).fit(self.df)
+        self.df = self.df[detector.mask(self.df)]
+        self._record_step((
+            "remove_outliers", tuple(detector.columns),
+            {"method": method, "threshold": detector.threshold, "lower": detector.lower, "upper": detector.upper}
+        ))
+        return detector.rejection_counts
+
+    def optimise_memory(self, category_threshold=0.5, date_columns=None, downcast_floats=False):
+        """
+        Reduce the memory used by the DataFrame.
+
+        Integer columns are downcast to the smallest type that holds their range, text columns
+        whose ratio of distinct values to rows is below category_threshold are converted to
+        categories, and month-year date columns are parsed once with a fixed, cached format.
+
+        Args:
+            category_threshold (float): Maximum ratio of distinct values to rows for a text column to become categorical.
+            date_columns (list, optional): Columns in '%b-%Y' format. If None, text columns whose values match the format are detected.
+            downcast_floats (bool): Whether to also downcast float columns to float32, at the cost of precision.
+        Returns:
+            dict: Memory usage in bytes before and after optimisation and the reduction factor.
+        """
+        bytes_before = int(self.df.memory_usage(deep=True).sum())
+        text_columns = [
+            column for column in self.df.columns
+            if pd.api.types.is_object_dtype(self.df[column]) or pd.api.types.is_string_dtype(self.df[column])
+        ]
+        if date_columns is None:
+            date_columns = [column for column in text_columns if _is_month_year(self.df[column])]
+        for column in date_columns:
+            self.df[column] = pd.to_datetime(self.df[column], format='%b-%Y', cache=True)
+        if date_columns:
+            self._record_step(("convert_dates_to_datetime", tuple(date_columns), {}))
+
+        row_count = max(len(self.df), 1)
+        categorical_columns = [
+            column for column in text_columns
+            if column not in date_columns and self.df[column].nunique() / row_count < category_threshold
+        ]
+        if categorical_columns:
+            self.convert_categorical_columns(categorical_columns)
+
+        kinds = {}
+        for column in self.df.select_dtypes(include=['integer', 'floating']).columns:
+            if pd.api.types.is_integer_dtype(self.df[column]):
+                kind = 'integer'
+            elif downcast_floats:
+                kind = 'float'
+            else:
+                continue
+            downcast = pd.to_numeric(self.df[column], downcast=kind)
+            if downcast.dtype != self.df[column].dtype:
+                self.df[column] = downcast
+                kinds[column] = kind
+        if kinds:
+            # The kind of downcast is recorded rather than the dtype picked from this frame's range,
+            # so transform() sizes each new batch to its own values instead of wrapping them.
+            self._record_step(("downcast", tuple(kinds), {"downcast": kinds}))
+
+        bytes_after = int(self.df.memory_usage(deep=True).sum())
+        reduction = bytes_before / bytes_after if bytes_after else float('inf')
+        status(f"Memory reduced from {bytes_before:,} to {bytes_after:,} bytes ({reduction:.1f}x).")
+        return {"bytes_before": bytes_before, "bytes_after": bytes_after, "reduction": reduction}
+
+    def transform(self, dataframe):
+        """
+        Apply the fitted transformations to a new DataFrame without refitting.
+
+        Fitted parameters (Box-Cox lambdas, imputed values, categories and z-score mean/std)
+        are taken from fitted_steps, so a reference sample can be cleaned once and the same
+        transformations applied cheaply to new chunks or streamed batches. Categories not seen
+        when fitting are appended to the fitted categories with a warning, so later batches
+        share the same categorical dtype.
+
+        Args:
+            dataframe (pd.DataFrame): DataFrame to be transformed.
+
+        Returns:
+            pd.DataFrame: The transformed DataFrame.
+        """
+        transformed, self.fitted_steps = _run_steps(dataframe.copy(), self.fitted_steps)
+        return transformed
+
+    def save_parameters(self, file_path="transform_parameters.yaml"):
+        """
+        Save the fitted transformations to a YAML file.
+
+        Args:
+            file_path (str): Path to the YAML file.
+        """
+        steps = [
+            {"operation": operation, "columns": list(columns), "params": _to_native(params)}
+            for operation, columns, params in self.fitted_steps
+        ]
+        with open(file_path, "w") as file:
+            yaml.safe_dump(steps, file, sort_keys=False)
+
+    def load_parameters(self, file_path="transform_parameters.yaml"):
+        """
+        Load fitted transformations from a YAML file, replacing fitted_steps.
+
+        Args:
+            file_path (str): Path to the YAML file.
+        """
+        with open(file_path, "r") as file:
+            steps = yaml.safe_load(file) or []
+        self.fitted_steps = [(step["operation"], tuple(step["columns"]), step["params"]) for step in steps]
+
+
+@instrumented
+class LazyDataTransform:
+    """
+    A lazy pipeline that records DataTransform operations as a plan and runs them in a single pass.
+
+    Column drops are applied before anything is read, cheap missing-value row filters are
+    moved ahead of more expensive steps where the result is unchanged, and adjacent filters are
+    fused. Consecutive row filters are combined into one boolean mask, which is applied before
+    the next step that transforms column values, so hoisted filters spare those steps the
+    dropped rows. Peak memory therefore stays close to one extra copy of the input.
+
+    Attributes:
+        transform (DataTransform): The DataTransform whose DataFrame the plan is applied to.
+        plan (list): Recorded steps as (operation, columns, params) tuples.
+
+    Methods:
+        convert_dates_to_datetime(date_columns): Record a conversion of columns to datetime format.
+        convert_categorical_columns(categorical_columns): Record a conversion of columns to categorical data type.
+        drop_rows(dropped_rows): Record dropping rows with missing values in specified columns.
+        drop_columns(columns_to_drop): Record dropping specified columns.
+        impute_mode(column_to_impute): Record imputing missing values in a column with its mode.
+        impute_mean(column_to_impute): Record imputing missing values in a column with its mean.
+        log_transform(column_to_transform): Record a log transformation of a column.
+        boxcox_transform(column_to_transform): Record a Box-Cox transformation of a column.
+        remove_outliers_zscore(column_to_transform, z_threshold=2): Record removing outliers using z-score method.
+        remove_outliers(columns_to_transform, method="zscore", threshold=None): Record removing rows that are outliers in any of several columns.
+        optimised_plan(): Get the plan after column drops are hoisted and row filters are reordered and fused.
+        collect(): Run the optimised plan and return the transformed DataFrame.
+    """
+    ELEMENTWISE_OPERATIONS = {"convert_dates_to_datetime", "log_transform"}
+
+    def __init__(self, transform):
+        self.transform = transform
+        self.plan = []
+
+    def _record(self, operation, columns, **params):
+        if isinstance(columns, str):
+            columns = [columns]
+        self.plan.append((operation, tuple(columns), params))
+        return self
+
+    def convert_dates_to_datetime(self, date_columns):
+        """
+        Record a conversion of specified columns to datetime format.
+
+        Args:
+            date_columns (list): List of column names to be converted to datetime format.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("convert_dates_to_datetime", date_columns)
+
+    def convert_categorical_columns(self, categorical_columns):
+        """
+        Record a conversion of specified columns to categorical data type.
+
+        Args:
+            categorical_columns (list): List of column names to be converted to categorical data type.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("convert_categorical_columns", categorical_columns)
+
+    def drop_rows(self, dropped_rows):
+        """
+        Record dropping rows with missing values in specified columns.
+
+        Args:
+            dropped_rows (list): List of column names to check for missing values.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("drop_rows", dropped_rows)
+
+    def drop_columns(self, columns_to_drop):
+        """
+        Record dropping specified columns from the DataFrame.
+
+        Args:
+            columns_to_drop (list): List of column names to be dropped from the DataFrame.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("drop_columns", columns_to_drop)
+
+    def impute_mode(self, column_to_impute):
+        """
+        Record imputing missing values in a column with its mode.
+
+        Args:
+            column_to_impute (str): Name of the column to be imputed.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("impute_mode", column_to_impute)
+
+    def impute_mean(self, column_to_impute):
+        """
+        Record imputing missing values in a column with its mean.
+
+        Args:
+            column_to_impute (str): Name of the column to be imputed.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("impute_mean", column_to_impute)
+
+    def log_transform(self, column_to_transform):
+        """
+        Record a log transformation of a specified column.
+
+        Args:
+            column_to_transform (str): Name of the column to be log-transformed.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("log_transform", column_to_transform)
+
+    def boxcox_transform(self, column_to_transform):
+        """
+        Record a Box-Cox transformation of a specified column.
+
+        Args:
+            column_to_transform (str or list): Name of the column, or list of column names, to be Box-Cox transformed.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("boxcox_transform", column_to_transform)
+
+    def remove_outliers_zscore(self, column_to_transform, z_threshold=2):
+        """
+        Record removing outliers using z-score method.
+
+        Args:
+            column_to_transform (str or list): Name of the column, or list of column names, to be processed for outlier removal.
+            z_threshold (float): Z-score threshold beyond which values are considered outliers.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("remove_outliers_zscore", column_to_transform, z_threshold=z_threshold)
+
+    def remove_outliers(self, columns_to_transform, method="zscore", threshold=None):
+        """
+        Record removing rows that are outliers in any of several columns.
+
+        Args:
+            columns_to_transform (list): List of column names to be processed for outlier removal.
+            method (str): 'zscore', 'iqr' or 'mad'.
+            threshold (float, optional): Multiplier applied to each column's spread. Defaults to the method's default.
+
+        Returns:
+            LazyDataTransform: This pipeline, so calls can be chained.
+        """
+        return self._record("remove_outliers", columns_to_transform, method=method, threshold=threshold)
+
+    def optimised_plan(self):
+        """
+        Get the plan after column drops are hoisted and row filters are reordered and fused.
+
+        Returns:
+            tuple: Columns that can be dropped before any step runs, and the remaining list of steps.
+        """
+        projected = []
+        steps = []
+        for index, (operation, columns, params) in enumerate(self.plan):
+            if operation != "drop_columns":
+                steps.append((operation, columns, params))
+                continue
+            used_earlier = {column for _, step_columns, _ in self.plan[:index] for column in step_columns}
+            projected.extend(column for column in columns if column not in used_earlier and column not in projected)
+            remaining = tuple(column for column in columns if column in used_earlier)
+            if remaining:
+                steps.append((operation, remaining, params))
+
+        optimised = []
+        for operation, columns, params in steps:
+            position = len(optimised)
+            if operation == "drop_rows":
+                while position > 0:
+                    previous_operation, previous_columns, _ = optimised[position - 1]
+                    if previous_operation in self.ELEMENTWISE_OPERATIONS and not set(previous_columns) & set(columns):
+                        position -= 1
+                    else:
+                        break
+                if position > 0 and optimised[position - 1][0] == "drop_rows":
+                    fused = optimised[position - 1][1] + tuple(c for c in columns if c not in optimised[position - 1][1])
+                    optimised[position - 1] = ("drop_rows", fused, {})
+                    continue
+            optimised.insert(position, (operation, columns, params))
+        return projected, optimised
+
+    def collect(self):
+        """
+        Run the optimised plan in one pass, store the result on the DataTransform and return it.
+
+        Returns:
+            pd.DataFrame: The transformed DataFrame.
+        """
+        projected, steps = self.optimised_plan()
+        df, fitted_steps = _run_steps(self.transform.df.drop(columns=projected), steps)
+        if projected:
+            self.transform._record_step(("drop_columns", tuple(projected), {}))
+        for step in fitted_steps:
+            self.transform._record_step(step)
+        self.transform.df = df
+        self.plan = []
+        return df
+
+
+def _run_steps(df, steps):
+    """
+    Run transformation steps on a DataFrame in one pass, fitting any parameters a step does not already have.
+
+    Consecutive row filters are combined into a single boolean mask, applied before the next
+    step that transforms column values or at the end, and statistics are computed only on the
+    rows still kept when each step runs.
+
+    Args:
+        df (pd.DataFrame): DataFrame to transform; columns are replaced in place.
+        steps (list): Steps as (operation, columns, params) tuples.
+
+    Returns:
+        tuple: The transformed DataFrame and the steps with their fitted parameters.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    fitted_steps = []
+
+    def kept(column):
+        return df[column].to_numpy()[mask]
+
+    for operation, columns, params in steps:
+        params = copy.deepcopy(params)
+        if operation not in ("remove_outliers", "remove_outliers_zscore", "drop_rows", "drop_columns") and not mask.all():
+            df = df[mask]
+            mask = np.ones(len(df), dtype=bool)
+        if operation == "remove_outliers":
+            detector = OutlierDetector(columns, params["method"], params["threshold"])
+            if "lower" not in params:
+                detector.fit(df.loc[mask, list(columns)])
+                params.update(threshold=detector.threshold, lower=detector.lower, upper=detector.upper)
+            detector.lower, detector.upper = params["lower"], params["upper"]
+            mask &= detector.mask(df)
+        elif operation == "remove_outliers_zscore":
+            # Every column is fitted on the same rows before any outliers are removed, as in the eager method.
+            means = params.setdefault("mean", {})
+            stds = params.setdefault("std", {})
+            for column in columns:
+                if column not in means:
+                    values = kept(column).astype(float)
+                    means[column], stds[column] = values.mean(), values.std()
+            outliers = np.zeros(len(df), dtype=bool)
+            for column in columns:
+                outliers |= np.abs((df[column].to_numpy(dtype=float) - means[column]) / stds[column]) > params["z_threshold"]
+            mask &= ~outliers
+        elif operation == "drop_columns":
+            df.drop(columns=list(columns), inplace=True)
+        elif operation == "drop_rows":
+            mask &= df[list(columns)].notna().all(axis=1).to_numpy()
+        for column in columns:
+            if operation == "convert_dates_to_datetime":
+                df[column] = pd.to_datetime(df[column], format='%b-%Y')
+            elif operation == "convert_categorical_columns":
+                categories = params.setdefault("categories", {})
+                if column not in categories:
+                    categories[column] = pd.Series(kept(column)).astype('category').cat.categories.tolist()
+                # Values unseen when fitting would become NaN; append them so existing codes stay stable.
+                unseen = pd.Series(kept(column)).dropna()
+                unseen = sorted(set(unseen[~unseen.isin(categories[column])].tolist()))
+                if unseen:
+                    status(f"New categories in {column}: {unseen}", level="warning")
+                    categories[column] = categories[column] + unseen
+                df[column] = df[column].astype(pd.CategoricalDtype(categories[column]))
+            elif operation in ("impute_mode", "impute_mean"):
+                values = params.setdefault("values", {})
+                if column not in values:
+                    kept_values = pd.Series(kept(column))
+                    values[column] = kept_values.mode()[0] if operation == "impute_mode" else kept_values.mean()
+                df[column] = df[column].fillna(values[column])
+            elif operation == "log_transform":
+                df[column] = np.log1p(df[column])
+            elif operation == "downcast":
+                df[column] = pd.to_numeric(df[column], downcast=params["downcast"][column])
+            elif operation == "boxcox_transform":
+                from scipy import special
+                from scipy.stats import boxcox
+                lmbdas = params.setdefault("lmbda", {})
+                if column not in lmbdas:
+                    _, lmbdas[column] = boxcox(kept(column))
+                df[column] = special.boxcox(df[column].to_numpy(dtype=float), lmbdas[column])
+        fitted_steps.append((operation, columns, params))
+
+    if not mask.all():
+        df = df[mask]
+    return df, fitted_steps
+
+
+def _zscore_outliers(values, z_threshold):
+    """
+    Flag the values whose z-score exceeds a threshold.
+
+    Args:
+        values (np.ndarray): Column values.
+        z_threshold (float): Z-score threshold beyond which values are considered outliers.
+
+    Returns:
+        tuple: Boolean outlier mask, and the mean and standard deviation used.
+    """
+    mean, std = values.mean(), values.std()
+    return np.abs((values - mean) / std) > z_threshold, mean, std
+
+
+def _is_month_year(column, sample_size=100):
+    """
+    Check whether a text column holds dates in '%b-%Y' format, e.g. 'Jan-2021'.
+
+    Args:
+        column (pd.Series): Column to check.
+        sample_size (int): Number of non-null values to test.
+
+    Returns:
+        bool: True if the sampled values all parse with the format.
+    """
+    sample = column.dropna().head(sample_size)
+    if sample.empty:
+        return False
+    try:
+        pd.to_datetime(sample, format='%b-%Y')
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _to_native(value):
+    """
+    Convert fitted parameters to plain Python types so they can be written to YAML.
+
+    Args:
+        value: A parameter value, possibly a NumPy scalar or a nested dict/list.
+
+    Returns:
+        The value using only built-in Python types.
+    """
+    if isinstance(value, dict):
+        return {key: _to_native(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_native(item) for item in value]
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
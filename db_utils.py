@@ -1,15 +1,23 @@
-import psycopg2
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
+
+from instrumentation import instrumented, status
 
 
+@instrumented
 class RDSDatabaseConnector:
     """
     A class for connecting to an Amazon RDS PostgreSQL database, extracting and saving data.
 
     Attributes:
-        credentials_file (str): Path to the YAML file containing RDS credentials.
+        credentials_file (str): Path to the YAML file containing RDS credentials, or None to only use the file methods.
         credentials (dict): Dictionary containing RDS connection credentials.
         connection: psycopg2 connection object.
         cursor: psycopg2 cursor object.
@@ -19,14 +27,20 @@ class RDSDatabaseConnector:
         load_credentials(): Load RDS credentials from a YAML file.
         connect(): Establish a connection to the RDS database.
         disconnect(): Disconnect from the RDS database.
-        initialize_engine(): Initialize the SQLAlchemy engine for the RDS connection.
+        initialise_engine(pool_size=5, max_overflow=0): Initialise a pooled SQLAlchemy engine for the RDS connection.
         extract_data_to_dataframe(table_name="loan_payments"): Extract data from a specified table and return as a Pandas DataFrame.
+        stream_data_to_dataframe(table_name="loan_payments", chunk_size=10000, dtypes=None): Stream a table through a server-side cursor as DataFrame chunks.
+        extract_partitioned_data(table_name="loan_payments", partition_column="id", partitions=8, max_connections=4, retries=3): Extract a table concurrently in key ranges and reassemble it in order.
         save_data_to_csv(data_frame, file_path="output_data.csv", index=True): Save a Pandas DataFrame to a CSV file.
-        load_data_from_csv(file_path="output_data.csv"): Load data from a CSV file into a Pandas DataFrame.
+        load_data_from_csv(file_path="output_data.csv", chunksize=None): Load data from a CSV file into a Pandas DataFrame, or an iterator of chunks.
+        save_data_to_cache(data_frame, file_path="loan_payments.parquet", row_group_size=100000): Save a Pandas DataFrame to a Parquet or Feather file with dtypes preserved.
+        load_data_from_cache(file_path="loan_payments.parquet", columns=None, filters=None, memory_map=True): Load selected columns and rows from a Parquet or Feather file.
+        stream_data_from_cache(file_path="loan_payments.parquet", columns=None, batch_size=100000): Stream a Parquet or Feather file as DataFrame chunks.
+        sync_table_to_cache(table_name="loan_payments", file_path="loan_payments.parquet", key_column="id", watermark_column="last_payment_date", watermark_format="Mon-YYYY", state_file="sync_state.yaml"): Incrementally update a cached table with rows changed since the last sync.
     """
     def __init__(self, credentials_file="credentials.yaml"):
         self.credentials_file = credentials_file
-        self.credentials = self.load_credentials()
+        self.credentials = self.load_credentials() if credentials_file else None
         self.connection = None
         self.cursor = None
         self.engine = None
@@ -38,19 +52,14 @@ class RDSDatabaseConnector:
         Returns:
             dict: Dictionary containing RDS connection credentials.
         """
-        try:
-            with open(self.credentials_file, "r") as file:
-                credentials = yaml.safe_load(file)
-            return credentials
-        except Exception as e:
-            print(f"Error loading credentials: {e}")
-            return None
+        return _load_credentials(self.credentials_file)
 
     def connect(self):
         """
         Establish a connection to the RDS database.
         """
         try:
+            import psycopg2
             self.connection = psycopg2.connect(
                 host=self.credentials['RDS_HOST'],
                 user=self.credentials['RDS_USER'],
@@ -59,9 +68,9 @@ class RDSDatabaseConnector:
                 port=self.credentials['RDS_PORT']
             )
             self.cursor = self.connection.cursor()
-            print("Connected to the database.")
+            status("Connected to the database.")
         except Exception as e:
-            print(f"Error connecting to the database: {e}")
+            status(f"Error connecting to the database: {e}", level="error")
 
     def disconnect(self):
         """
@@ -70,19 +79,30 @@ class RDSDatabaseConnector:
         if self.connection:
             self.cursor.close()
             self.connection.close()
-            print("Disconnected from the database.")
+            status("Disconnected from the database.")
 
-    def initialise_engine(self):
+    def initialise_engine(self, pool_size=5, max_overflow=0):
         """
         Initialise the SQLAlchemy engine for the RDS connection.
+
+        The engine keeps a bounded pool of connections that are reused across queries,
+        so concurrent extractions never open more than pool_size + max_overflow connections.
+
+        Args:
+            pool_size (int): Number of connections kept open in the pool.
+            max_overflow (int): Number of extra connections allowed beyond pool_size under load.
         """
         try:
+            from sqlalchemy import create_engine
             self.engine = create_engine(
-                f"postgresql+psycopg2://{self.credentials['RDS_USER']}:{self.credentials['RDS_PASSWORD']}@{self.credentials['RDS_HOST']}:{self.credentials['RDS_PORT']}/{self.credentials['RDS_DATABASE']}"
+                _database_url(self.credentials, "psycopg2"),
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True
             )
-            print("Engine initialized.")
+            status("Engine initialized.")
         except Exception as e:
-            print(f"Error initializing engine: {e}")
+            status(f"Error initializing engine: {e}", level="error")
 
     def extract_data_to_dataframe(self, table_name="table_name"):
         """
@@ -97,10 +117,156 @@ class RDSDatabaseConnector:
         try:
             query = f"SELECT * FROM {table_name};"
             data_frame = pd.read_sql_query(query, self.engine)
-            print("Data extracted to Pandas DataFrame.")
+            status("Data extracted to Pandas DataFrame.")
+            return data_frame
+        except Exception as e:
+            status(f"Error extracting data: {e}", level="error")
+            return None
+
+    def stream_data_to_dataframe(self, table_name="table_name", chunk_size=10000, dtypes=None):
+        """
+        Stream data from a specified table as Pandas DataFrame chunks using a server-side cursor.
+
+        Rows are fetched from a named psycopg2 cursor, so only `chunk_size` rows are held
+        in memory at a time and the first chunk is available as soon as it arrives.
+        Requires an open connection (see connect()), whose transaction is rolled back once the
+        cursor is closed. Errors are reported and re-raised, so a failure part way through is
+        never mistaken for the end of the table.
+
+        Each column keeps the dtype inferred from the first chunk in which it has values, so
+        every chunk has the same dtypes. A column whose later values do not fit that dtype is
+        widened to float64 or object from then on, with a warning.
+
+        Args:
+            table_name (str): Name of the table to extract data from.
+            chunk_size (int): Number of rows fetched from the server per chunk.
+            dtypes (dict, optional): Mapping of column names to dtypes applied to every chunk.
+                Columns not listed have their dtypes inferred.
+
+        Yields:
+            pd.DataFrame: Pandas DataFrame containing the next chunk of rows.
+        """
+        cursor = None
+        try:
+            cursor = self.connection.cursor(name=f"stream_{table_name}")
+            cursor.itersize = chunk_size
+            cursor.execute(f"SELECT * FROM {table_name};")
+            columns = None
+            fixed = {}
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = [description[0] for description in cursor.description]
+                chunk = pd.DataFrame.from_records(rows, columns=columns).infer_objects()
+                if dtypes:
+                    chunk = chunk.astype(dtypes)
+                yield self._fix_chunk_dtypes(chunk, fixed, dtypes or {})
+            status("Data streamed to Pandas DataFrame chunks.")
+        except Exception as e:
+            status(f"Error streaming data: {e}", level="error")
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+                self.connection.rollback()
+
+    @staticmethod
+    def _fix_chunk_dtypes(chunk, fixed, dtypes):
+        """
+        Cast a streamed chunk to the dtypes of earlier chunks, recording the dtypes of columns seen with values for the first time.
+
+        Args:
+            chunk (pd.DataFrame): Chunk with inferred dtypes.
+            fixed (dict): Column dtypes fixed by earlier chunks, updated in place.
+            dtypes (dict): Columns whose dtypes were given explicitly and are left as they are.
+
+        Returns:
+            pd.DataFrame: Chunk with the fixed dtypes.
+        """
+        for column in chunk.columns:
+            if column in dtypes:
+                continue
+            values = chunk[column]
+            if column not in fixed:
+                if values.notna().any():
+                    fixed[column] = values.dtype
+                continue
+            if values.dtype == fixed[column]:
+                continue
+            try:
+                if pd.api.types.is_bool_dtype(fixed[column]) and values.isna().any():
+                    raise ValueError("null values in a boolean column")
+                chunk[column] = values.astype(fixed[column])
+            except (TypeError, ValueError):
+                numeric = pd.api.types.is_numeric_dtype(values) and pd.api.types.is_numeric_dtype(fixed[column])
+                fixed[column] = np.dtype(float if numeric else object)
+                status(f"Column {column} no longer fits its inferred dtype; widening it to {fixed[column]}.", level="warning")
+                chunk[column] = values.astype(fixed[column])
+        return chunk
+
+    def extract_partitioned_data(self, table_name="table_name", partition_column="id", partitions=8, max_connections=4, retries=3):
+        """
+        Extract data from a specified table by splitting it into ranges of a numeric key and pulling them concurrently.
+
+        Each range is read on its own pooled connection by a thread pool and retried on
+        failure; the results are concatenated in key order, followed by any rows whose key is
+        NULL, and each column is given one dtype across all partitions. Requires an initialised engine
+        whose pool allows at least max_connections connections (see initialise_engine()).
+
+        Args:
+            table_name (str): Name of the table to extract data from.
+            partition_column (str): Numeric column used to split the table, e.g. 'id' or 'member_id'.
+            partitions (int): Number of key ranges to split the table into.
+            max_connections (int): Maximum number of partitions extracted at the same time.
+            retries (int): Number of attempts made for each partition before giving up, at least 1.
+
+        Returns:
+            pd.DataFrame: Pandas DataFrame containing the extracted data.
+        """
+        if partitions < 1 or retries < 1:
+            raise ValueError("partitions and retries must be at least 1.")
+        try:
+            from sqlalchemy import text
+            with self.engine.connect() as connection:
+                lower, upper = connection.execute(
+                    text(f"SELECT MIN({partition_column}), MAX({partition_column}) FROM {table_name};")
+                ).one()
+            if lower is None:
+                return self.extract_data_to_dataframe(table_name)
+            # Python integers keep bigint keys above 2**53 exact, which float bounds would not.
+            lower, upper = math.floor(lower), math.floor(upper) + 1
+            bounds = sorted({lower + (upper - lower) * position // partitions for position in range(partitions + 1)})
+            # No range matches a NULL key, so those rows are read as one extra partition.
+            ranges = list(zip(bounds[:-1], bounds[1:])) + [None]
+
+            def extract_range(key_range):
+                if key_range is None:
+                    query, params = text(f"SELECT * FROM {table_name} WHERE {partition_column} IS NULL;"), {}
+                else:
+                    query = text(
+                        f"SELECT * FROM {table_name} "
+                        f"WHERE {partition_column} >= :lower AND {partition_column} < :upper "
+                        f"ORDER BY {partition_column};"
+                    )
+                    params = {"lower": key_range[0], "upper": key_range[1]}
+                for attempt in range(1, retries + 1):
+                    try:
+                        return pd.read_sql_query(query, self.engine, params=params)
+                    except Exception as e:
+                        if attempt == retries:
+                            raise
+                        status(f"Retrying partition {key_range} after error: {e}", level="warning")
+                        time.sleep(2 ** (attempt - 1))
+
+            with ThreadPoolExecutor(max_workers=max_connections) as executor:
+                data_frames = list(executor.map(extract_range, ranges))
+            data_frame = pd.concat(_reconcile_dtypes(data_frames), ignore_index=True)
+            status(f"Data extracted to Pandas DataFrame from {len(ranges)} partitions.")
             return data_frame
         except Exception as e:
-            print(f"Error extracting data: {e}")
+            status(f"Error extracting partitioned data: {e}", level="error")
             return None
 
     def save_data_to_csv(self, data_frame, file_path="output_data.csv", index=True):
@@ -114,25 +280,422 @@ class RDSDatabaseConnector:
         """
         try:
             data_frame.to_csv(file_path, index=index)
-            print(f"Data saved to {file_path}.")
+            status(f"Data saved to {file_path}.")
         except Exception as e:
-            print(f"Error saving data: {e}")
+            status(f"Error saving data: {e}", level="error")
 
-    def load_data_from_csv(self, file_path="output_data.csv"):
+    def load_data_from_csv(self, file_path="output_data.csv", chunksize=None):
         """
         Load data from a CSV file into a Pandas DataFrame.
 
         Args:
             file_path (str): Path to the CSV file.
+            chunksize (int, optional): If given, return an iterator of DataFrame chunks with this many rows.
+
+        Returns:
+            pd.DataFrame: Pandas DataFrame containing the loaded data, or an iterator of chunks.
+        """
+        try:
+            data_frame = pd.read_csv(file_path, chunksize=chunksize)
+            status(f"Data loaded from {file_path}.")
+            return data_frame
+        except Exception as e:
+            status(f"Error loading data: {e}", level="error")
+            return None
+
+    def save_data_to_cache(self, data_frame, file_path="loan_payments.parquet", row_group_size=100000):
+        """
+        Save a Pandas DataFrame to a columnar Parquet or Feather file.
+
+        Dtypes such as datetime and category columns are stored with the data, so the frame
+        is loaded back exactly as it was saved. The format is chosen from the file extension
+        ('.parquet' or '.feather'). Feather files are written uncompressed, so loading them
+        memory-maps the columns without decoding them, at the cost of files several times the
+        size of compressed Parquet; use Parquet when disk space matters more than load time.
+
+        Args:
+            data_frame (pd.DataFrame): Pandas DataFrame to be saved.
+            file_path (str): Path to the Parquet or Feather file.
+            row_group_size (int): Number of rows per Parquet row group; smaller groups allow
+                finer row filtering on load.
+
+        Returns:
+            bool: True if the file was written, False on error.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(data_frame, preserve_index=False)
+            if self._cache_format(file_path) == "feather":
+                feather.write_feather(table, file_path, compression="uncompressed", chunksize=row_group_size)
+            else:
+                pq.write_table(table, file_path, row_group_size=row_group_size)
+            status(f"Data cached to {file_path}.")
+            return True
+        except Exception as e:
+            status(f"Error caching data: {e}", level="error")
+            return False
+
+    def load_data_from_cache(self, file_path="loan_payments.parquet", columns=None, filters=None, memory_map=True):
+        """
+        Load data from a Parquet or Feather file into a Pandas DataFrame.
+
+        Only the requested columns are read. For Parquet files, row groups whose statistics
+        cannot match the filters are skipped without being read.
+
+        Args:
+            file_path (str): Path to the Parquet or Feather file.
+            columns (list, optional): List of column names to load. If None, loads all columns.
+            filters (list, optional): Row filters as (column, operator, value) tuples,
+                e.g. [('loan_status', '==', 'Charged Off'), ('int_rate', '>', 10)].
+            memory_map (bool): Whether to memory-map the file instead of reading it into memory.
+                Only uncompressed Feather files are used in place; compressed data is decoded into memory.
 
         Returns:
             pd.DataFrame: Pandas DataFrame containing the loaded data.
         """
         try:
-            data_frame = pd.read_csv(file_path)
-            print(f"Data loaded from {file_path}.")
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+            if self._cache_format(file_path) == "feather":
+                table = feather.read_table(file_path, columns=columns, memory_map=memory_map)
+                if filters:
+                    table = table.filter(pq.filters_to_expression(filters))
+            else:
+                table = pq.read_table(file_path, columns=columns, filters=filters, memory_map=memory_map)
+            data_frame = table.to_pandas()
+            status(f"Data loaded from {file_path}.")
+            return data_frame
+        except Exception as e:
+            status(f"Error loading cached data: {e}", level="error")
+            return None
+
+    def stream_data_from_cache(self, file_path="loan_payments.parquet", columns=None, batch_size=100000):
+        """
+        Stream data from a Parquet or Feather file as Pandas DataFrame chunks.
+
+        Parquet files are read one batch of row groups at a time; Feather files are
+        memory-mapped and converted one record batch at a time. Errors are reported and
+        re-raised, so a corrupt file is never mistaken for a short one.
+
+        Args:
+            file_path (str): Path to the Parquet or Feather file.
+            columns (list, optional): List of column names to load. If None, loads all columns.
+            batch_size (int): Maximum number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: Pandas DataFrame containing the next chunk of rows.
+        """
+        try:
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+            if self._cache_format(file_path) == "feather":
+                batches = feather.read_table(file_path, columns=columns, memory_map=True).to_batches(max_chunksize=batch_size)
+            else:
+                batches = pq.ParquetFile(file_path, memory_map=True).iter_batches(batch_size=batch_size, columns=columns)
+            for batch in batches:
+                yield batch.to_pandas()
+        except Exception as e:
+            status(f"Error streaming cached data: {e}", level="error")
+            raise
+
+    def sync_table_to_cache(self, table_name="table_name", file_path="loan_payments.parquet", key_column="id",
+                            watermark_column="last_payment_date", watermark_format="Mon-YYYY", state_file="sync_state.yaml"):
+        """
+        Incrementally sync a table into a local Parquet or Feather cache.
+
+        A high-water mark (the latest watermark value and largest key) is kept per table in
+        state_file. The first sync extracts the whole table; later syncs only fetch rows whose
+        watermark is at or after the stored mark, or whose key is new, and merge them into the
+        cached copy by key_column. Rows from the boundary period are fetched again so that
+        updates made after the previous sync within the same period are not missed. A mark
+        that was empty at the previous sync (e.g. the table had no rows) is left out of the
+        filter, and the whole table is extracted again if both were empty or the cache file
+        cannot be read. The stored marks only advance once the cache has been saved, so a
+        failed extraction or save leaves both the cache and the state as they were.
+
+        Args:
+            table_name (str): Name of the table to sync.
+            file_path (str): Path to the Parquet or Feather cache file.
+            key_column (str): Unique key column used to merge updated rows.
+            watermark_column (str): Column that advances when a row changes.
+            watermark_format (str, optional): PostgreSQL to_date format used to parse a text
+                watermark column, e.g. 'Mon-YYYY' for 'Jan-2022'. If None, the column is compared as is.
+            state_file (str): Path to the YAML file storing the high-water marks.
+
+        Returns:
+            pd.DataFrame: Pandas DataFrame containing the synced table.
+        """
+        try:
+            from sqlalchemy import text
+            state = {}
+            if os.path.exists(state_file):
+                with open(state_file, "r") as file:
+                    state = yaml.safe_load(file) or {}
+            watermark = f"to_date({watermark_column}, '{watermark_format}')" if watermark_format else watermark_column
+            with self.engine.connect() as connection:
+                high_water, max_key = connection.execute(
+                    text(f"SELECT MAX({watermark}), MAX({key_column}) FROM {table_name};")
+                ).one()
+
+            table_state = state.get(table_name) or {}
+            params = {name: table_state.get(name) for name in ("watermark", "key") if table_state.get(name) is not None}
+            data_frame = None
+            saved = True
+            if params and os.path.exists(file_path):
+                predicates = {"watermark": f"{watermark} >= :watermark", "key": f"{key_column} > :key"}
+                query = text(
+                    f"SELECT * FROM {table_name} "
+                    f"WHERE {' OR '.join(predicates[name] for name in params)};"
+                )
+                delta = pd.read_sql_query(query, self.engine, params=params)
+                data_frame = self.load_data_from_cache(file_path)
+                if data_frame is None:
+                    status(f"Could not read {file_path}; extracting the whole table again.", level="warning")
+                else:
+                    if not delta.empty:
+                        data_frame = (
+                            pd.concat([data_frame, delta], ignore_index=True)
+                            .drop_duplicates(subset=key_column, keep="last")
+                            .sort_values(key_column, ignore_index=True)
+                        )
+                        saved = self.save_data_to_cache(data_frame, file_path)
+                    status(f"Synced {len(delta)} new or updated rows from {table_name}.")
+            if data_frame is None:
+                data_frame = self.extract_data_to_dataframe(table_name)
+                if data_frame is None:
+                    raise RuntimeError(f"could not extract {table_name}")
+                saved = self.save_data_to_cache(data_frame, file_path)
+            if not saved:
+                raise RuntimeError(f"could not save {file_path}")
+
+            state[table_name] = {
+                "watermark": None if high_water is None else str(high_water),
+                "key": None if max_key is None else int(max_key)
+            }
+            with open(state_file, "w") as file:
+                yaml.safe_dump(state, file)
+            return data_frame
+        except Exception as e:
+            status(f"Error syncing data: {e}", level="error")
+            return None
+
+    @staticmethod
+    def _cache_format(file_path):
+        """
+        Get the columnar cache format from a file extension.
+
+        Args:
+            file_path (str): Path to the cache file.
+
+        Returns:
+            str: 'feather' for '.feather' or '.arrow' files, otherwise 'parquet'.
+        """
+        if str(file_path).endswith((".feather", ".arrow")):
+            return "feather"
+        return "parquet"
+
+
+@instrumented
+class AsyncRDSDatabaseConnector:
+    """
+    A class for extracting several tables or queries concurrently with asyncio.
+
+    Queries run on a pooled SQLAlchemy async engine, by default backed by the asyncpg PostgreSQL
+    driver and the RDS credentials. Any other async database URL can be given instead, e.g.
+    'sqlite+aiosqlite:///loans.db' as a local stand-in. At most max_concurrency queries run at
+    the same time, each query can time out, and cancelling extract_many() cancels the queries
+    still running (drivers that cannot interrupt a query, such as aiosqlite, let it finish
+    first). The engine and concurrency limit belong to one event loop; call dispose()
+    before reusing the connector from another, e.g. a second asyncio.run().
+
+    Attributes:
+        credentials_file (str): Path to the YAML file containing RDS credentials.
+        credentials (dict): Dictionary containing RDS connection credentials, or None when url is given.
+        url (str): SQLAlchemy async database URL.
+        max_concurrency (int): Maximum number of queries running at the same time.
+        engine: SQLAlchemy async engine object.
+
+    Methods:
+        load_credentials(): Load RDS credentials from a YAML file.
+        initialise_engine(pool_size=5, max_overflow=0): Initialise the pooled async engine.
+        extract(table_name="table_name", query=None, params=None, timeout=None): Extract a table or query into a Pandas DataFrame.
+        extract_many(requests, timeout=None, total_timeout=None): Extract several tables or queries concurrently.
+        dispose(): Close all pooled connections.
+    """
+    def __init__(self, credentials_file="credentials.yaml", url=None, max_concurrency=4):
+        self.credentials_file = credentials_file
+        self.credentials = None
+        if url is None:
+            self.credentials = self.load_credentials()
+            if self.credentials:
+                url = _database_url(self.credentials, "asyncpg")
+        self.url = url
+        self.max_concurrency = max_concurrency
+        self.engine = None
+        self._semaphore = None
+
+    def load_credentials(self):
+        """
+        Load RDS credentials from a YAML file.
+
+        Returns:
+            dict: Dictionary containing RDS connection credentials.
+        """
+        return _load_credentials(self.credentials_file)
+
+    def initialise_engine(self, pool_size=5, max_overflow=0):
+        """
+        Initialise the pooled SQLAlchemy async engine.
+
+        Args:
+            pool_size (int): Number of connections kept open in the pool.
+            max_overflow (int): Number of extra connections allowed beyond pool_size under load.
+        """
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+            pool_options = {} if self.url.startswith("sqlite") else {"pool_size": pool_size, "max_overflow": max_overflow}
+            self.engine = create_async_engine(self.url, pool_pre_ping=True, **pool_options)
+            status("Async engine initialized.")
+        except Exception as e:
+            status(f"Error initializing async engine: {e}", level="error")
+
+    async def extract(self, table_name="table_name", query=None, params=None, timeout=None):
+        """
+        Extract a table or query into a Pandas DataFrame, waiting for a free slot under the concurrency limit.
+
+        Args:
+            table_name (str): Name of the table to extract data from.
+            query (str, optional): SQL query to run instead of selecting the whole table.
+            params (dict, optional): Bound parameters of the query.
+            timeout (float, optional): Seconds after which the query is cancelled.
+
+        Returns:
+            pd.DataFrame: Pandas DataFrame containing the extracted data, or None on error or timeout.
+        """
+        from sqlalchemy import text
+        if self.engine is None:
+            self.initialise_engine(pool_size=self.max_concurrency)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        statement = text(query or f"SELECT * FROM {table_name};")
+        try:
+            async with self._semaphore:
+                data_frame = await asyncio.wait_for(self._read(statement, params), timeout)
+            status(f"Data extracted to Pandas DataFrame from {table_name}.")
             return data_frame
+        except asyncio.TimeoutError:
+            status(f"Timed out extracting {table_name} after {timeout} seconds.", level="error")
+            return None
         except Exception as e:
-            print(f"Error loading data: {e}")
+            status(f"Error extracting {table_name}: {e}", level="error")
             return None
-        
\ No newline at end of file
+
+    async def _read(self, statement, params):
+        async with self.engine.connect() as connection:
+            result = await connection.execute(statement, params or {})
+            return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+    async def extract_many(self, requests, timeout=None, total_timeout=None):
+        """
+        Extract several tables or queries concurrently.
+
+        Args:
+            requests (list or dict): Table names, or a dict of names to SQL queries or (query, params) tuples.
+            timeout (float, optional): Seconds after which each query is cancelled.
+            total_timeout (float, optional): Seconds after which every unfinished query is cancelled.
+
+        Returns:
+            dict: Pandas DataFrame per name, or None for queries that failed, timed out or were cancelled.
+        """
+        if not isinstance(requests, dict):
+            requests = {table_name: None for table_name in requests}
+        tasks = {}
+        for name, request in requests.items():
+            query, params = request if isinstance(request, tuple) else (request, None)
+            tasks[name] = asyncio.ensure_future(self.extract(name, query, params, timeout))
+        if not tasks:
+            return {}
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=total_timeout)
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            status(f"Cancelled {len(pending)} extractions after {total_timeout} seconds.", level="error")
+        return {name: None if task.cancelled() else task.result() for name, task in tasks.items()}
+
+    async def dispose(self):
+        """
+        Close all pooled connections.
+        """
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+            self._semaphore = None
+            status("Async engine disposed.")
+
+
+def _reconcile_dtypes(data_frames):
+    """
+    Give each column one dtype across DataFrames whose dtypes were inferred separately.
+
+    Empty DataFrames are dropped, and columns that are all null in a DataFrame take the dtype
+    the column has elsewhere, widened to float or object when integer or boolean values meet nulls.
+    """
+    data_frames = [data_frame for data_frame in data_frames if not data_frame.empty] or data_frames[:1]
+    dtypes = {}
+    for column in data_frames[0].columns:
+        present = [data_frame[column].dropna().iloc[:1] for data_frame in data_frames if data_frame[column].notna().any()]
+        if not present:
+            continue
+        dtype = pd.concat(present).dtype
+        if any(data_frame[column].isna().any() for data_frame in data_frames):
+            if pd.api.types.is_bool_dtype(dtype):
+                dtype = object
+            elif pd.api.types.is_integer_dtype(dtype):
+                dtype = float
+        dtypes[column] = dtype
+    return [data_frame.astype(dtypes) for data_frame in data_frames]
+
+
+def _load_credentials(credentials_file):
+    """
+    Load RDS credentials from a YAML file.
+
+    Args:
+        credentials_file (str): Path to the YAML file containing RDS credentials.
+
+    Returns:
+        dict: Dictionary containing RDS connection credentials, or None on error.
+    """
+    try:
+        with open(credentials_file, "r") as file:
+            credentials = yaml.safe_load(file)
+        return credentials
+    except Exception as e:
+        status(f"Error loading credentials: {e}", level="error")
+        return None
+
+
+def _database_url(credentials, driver):
+    """
+    Build a SQLAlchemy PostgreSQL URL from RDS credentials.
+
+    Args:
+        credentials (dict): Dictionary containing RDS connection credentials.
+        driver (str): SQLAlchemy driver name, e.g. 'psycopg2' or 'asyncpg'.
+
+    Returns:
+        str: SQLAlchemy database URL.
+    """
+    return (
+        f"postgresql+{driver}://{credentials['RDS_USER']}:{credentials['RDS_PASSWORD']}"
+        f"@{credentials['RDS_HOST']}:{credentials['RDS_PORT']}/{credentials['RDS_DATABASE']}"
+    )
@@ -0,0 +1,378 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+
+class Instrumentation:
+    """
+    A class for recording opt-in profiling data from the instrumented classes and their status messages.
+
+    While enabled, every public method call of a class decorated with @instrumented is recorded
+    with its wall time, rows in (the instance's DataFrame, or the first DataFrame argument),
+    rows out (the instance's DataFrame afterwards, or the returned DataFrame), bytes allocated
+    (peak traced memory during the call, when trace_memory is on) and new frames (DataFrame
+    objects replacing the instance's DataFrame, or returned or yielded by the call). New frames
+    count objects, not copied data: with copy-on-write a new frame may still share its columns
+    with the old one. Nested calls are recorded with their depth. Generator methods are
+    recorded once exhausted, timing only the work done inside the generator; their rows out
+    are the rows of the DataFrames yielded, or, for instances accumulating statistics over
+    chunks (such as DataFrameInfo), the data rows profiled rather than the summary rows
+    yielded. Coroutine methods are recorded with their wall time from start to finish,
+    including time spent waiting, and without bytes allocated or nesting.
+    Disabled, the decorated methods add a single flag check.
+
+    Status messages from all classes go through status(), which prints them unless quiet is
+    set and, while enabled, also records them as events.
+
+    Attributes:
+        enabled (bool): Whether calls and status messages are recorded.
+        trace_memory (bool): Whether bytes allocated are measured with tracemalloc.
+        quiet (bool): Whether status messages are recorded without printing them.
+        records (list): Recorded calls and status events as dictionaries.
+
+    Methods:
+        enable(trace_memory=False, quiet=False): Start recording.
+        disable(): Stop recording.
+        clear(): Remove all records.
+        status(message, level="info"): Print a status message and record it while enabled.
+        summary(): Get total and mean wall time, rows and bytes per method as a DataFrame.
+        export_json_lines(file_path): Write the records as one JSON object per line.
+        export_chrome_trace(file_path): Write the records in the Chrome trace event format.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.quiet = False
+        self.records = []
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+
+    def enable(self, trace_memory=False, quiet=False):
+        """
+        Start recording.
+
+        Args:
+            trace_memory (bool): Measure bytes allocated per call with tracemalloc, which slows allocation-heavy code.
+            quiet (bool): Record status messages without printing them.
+        """
+        self.trace_memory = trace_memory
+        self.quiet = quiet
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording, keeping the records.
+        """
+        self.enabled = False
+        self.quiet = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def clear(self):
+        """
+        Remove all records.
+        """
+        self.records = []
+
+    def status(self, message, level="info"):
+        """
+        Print a status message and record it while enabled.
+
+        Args:
+            message (str): Status message.
+            level (str): 'info', 'warning' or 'error'.
+        """
+        if not self.quiet:
+            print(message)
+        if self.enabled:
+            stack = self._stack()
+            self.records.append({
+                "type": "status",
+                "level": level,
+                "message": message,
+                "call": stack[-1]["name"] if stack else None,
+                "start": self._now(),
+                "thread": threading.get_ident(),
+                "pid": os.getpid(),
+            })
+
+    def summary(self):
+        """
+        Get total and mean wall time, rows and bytes per method.
+
+        Returns:
+            pd.DataFrame: One row per method, sorted by total wall time.
+        """
+        calls = pd.DataFrame([record for record in self.records if record["type"] == "call"])
+        if calls.empty:
+            return calls
+        summary = calls.groupby("name").agg(
+            calls=("seconds", "size"),
+            total_seconds=("seconds", "sum"),
+            mean_seconds=("seconds", "mean"),
+            rows_in=("rows_in", "sum"),
+            rows_out=("rows_out", "sum"),
+            bytes_allocated=("bytes_allocated", "sum"),
+            new_frames=("new_frames", "sum"),
+        )
+        return summary.sort_values("total_seconds", ascending=False)
+
+    def export_json_lines(self, file_path):
+        """
+        Write the records as one JSON object per line.
+
+        Args:
+            file_path (str): Path of the output file.
+        """
+        with open(file_path, "w") as file:
+            for record in self.records:
+                file.write(json.dumps(record, default=str) + "\n")
+
+    def export_chrome_trace(self, file_path):
+        """
+        Write the records in the Chrome trace event format, viewable in chrome://tracing or Perfetto.
+
+        Args:
+            file_path (str): Path of the output file.
+        """
+        events = []
+        for record in self.records:
+            event = {"name": record.get("name", record.get("message")), "pid": record["pid"],
+                     "tid": record["thread"], "ts": record["start"] * 1e6}
+            if record["type"] == "call":
+                event.update(ph="X", cat=record["name"].split(".")[0], dur=record["seconds"] * 1e6, args={
+                    key: record[key] for key in ("rows_in", "rows_out", "bytes_allocated", "new_frames", "depth")
+                })
+            else:
+                event.update(ph="i", s="t", cat="status", args={"level": record["level"], "call": record["call"]})
+            events.append(event)
+        with open(file_path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file, default=str)
+
+    def _now(self):
+        return time.perf_counter() - self._origin
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _enter(self, name, instance, args):
+        """
+        Start recording a call and return its frame.
+        """
+        stack = self._stack()
+        frame = {
+            "name": name,
+            "rows_in": _rows(getattr(instance, "df", None)),
+            "frame": getattr(instance, "df", None),
+            "elapsed": 0.0,
+            "start": self._now(),
+            "depth": len(stack),
+            "allocated_from": None,
+            "peak": 0,
+        }
+        if frame["rows_in"] is None:
+            frame["rows_in"] = next((len(arg) for arg in args if isinstance(arg, pd.DataFrame)), None)
+        stack.append(frame)
+        return frame
+
+    def _resume(self, frame):
+        """
+        Start or resume timing a frame.
+        """
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self._raise_parent_peak(frame, peak)
+            if frame["allocated_from"] is None:
+                frame["allocated_from"] = current
+            tracemalloc.reset_peak()
+        frame["resumed"] = time.perf_counter()
+
+    def _pause(self, frame):
+        """
+        Stop timing a frame, keeping its elapsed time and peak memory.
+        """
+        frame["elapsed"] += time.perf_counter() - frame["resumed"]
+        if self.trace_memory and tracemalloc.is_tracing():
+            frame["peak"] = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            self._raise_parent_peak(frame, frame["peak"])
+
+    def _raise_parent_peak(self, frame, peak):
+        stack = self._stack()
+        position = stack.index(frame) if frame in stack else len(stack)
+        if position > 0:
+            stack[position - 1]["peak"] = max(stack[position - 1]["peak"], peak)
+
+    def _exit(self, frame, instance, result, rows_out=None, new_frames=0):
+        """
+        Finish recording a call.
+        """
+        stack = self._stack()
+        if frame in stack:
+            stack.remove(frame)
+        df = getattr(instance, "df", None)
+        if isinstance(df, pd.DataFrame) and df is not frame["frame"]:
+            new_frames += 1
+        if isinstance(result, pd.DataFrame) and result is not df:
+            new_frames += 1
+        if rows_out is None:
+            rows_out = _rows(result) if isinstance(result, pd.DataFrame) else _rows(df)
+        allocated = None
+        if frame["allocated_from"] is not None:
+            allocated = max(frame["peak"] - frame["allocated_from"], 0)
+        self.records.append({
+            "type": "call",
+            "name": frame["name"],
+            "start": frame["start"],
+            "seconds": frame["elapsed"],
+            "rows_in": frame["rows_in"],
+            "rows_out": rows_out,
+            "bytes_allocated": allocated,
+            "new_frames": new_frames,
+            "depth": frame["depth"],
+            "thread": threading.get_ident(),
+            "pid": os.getpid(),
+        })
+
+
+instrumentation = Instrumentation()
+
+
+def status(message, level="info"):
+    """
+    Print a status message through the shared Instrumentation, recording it while enabled.
+
+    Args:
+        message (str): Status message.
+        level (str): 'info', 'warning' or 'error'.
+    """
+    instrumentation.status(message, level)
+
+
+def instrumented(cls):
+    """
+    Class decorator recording every public method call in the shared Instrumentation while it is enabled.
+
+    Args:
+        cls (type): Class to instrument.
+
+    Returns:
+        type: The same class with its public methods wrapped.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        if inspect.iscoroutinefunction(method):
+            wrapper = _wrap_coroutine
+        elif inspect.isgeneratorfunction(method):
+            wrapper = _wrap_generator
+        else:
+            wrapper = _wrap_method
+        setattr(cls, name, wrapper(method, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _wrap_method(method, name):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not instrumentation.enabled:
+            return method(self, *args, **kwargs)
+        frame = instrumentation._enter(name, self, args)
+        instrumentation._resume(frame)
+        result = None
+        try:
+            result = method(self, *args, **kwargs)
+            return result
+        finally:
+            instrumentation._pause(frame)
+            instrumentation._exit(frame, self, result)
+    return wrapper
+
+
+def _wrap_generator(method, name):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not instrumentation.enabled:
+            yield from method(self, *args, **kwargs)
+            return
+        frame = instrumentation._enter(name, self, args)
+        generator = method(self, *args, **kwargs)
+        rows_out = 0
+        new_frames = 0
+        profiled_from = _profiled_rows(self)
+        try:
+            while True:
+                instrumentation._resume(frame)
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    instrumentation._pause(frame)
+                if isinstance(item, pd.DataFrame):
+                    rows_out += len(item)
+                    new_frames += 1
+                instrumentation._stack().remove(frame)
+                try:
+                    yield item
+                finally:
+                    instrumentation._stack().append(frame)
+        finally:
+            generator.close()
+            if profiled_from is not None:
+                rows_out = None if isinstance(getattr(self, "df", None), pd.DataFrame) else _profiled_rows(self) - profiled_from
+            instrumentation._exit(frame, self, None, rows_out, new_frames)
+    return wrapper
+
+
+def _wrap_coroutine(method, name):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not instrumentation.enabled:
+            return await method(self, *args, **kwargs)
+        start = instrumentation._now()
+        started = time.perf_counter()
+        result = None
+        try:
+            result = await method(self, *args, **kwargs)
+            return result
+        finally:
+            instrumentation.records.append({
+                "type": "call",
+                "name": name,
+                "start": start,
+                "seconds": time.perf_counter() - started,
+                "rows_in": next((len(arg) for arg in args if isinstance(arg, pd.DataFrame)), None),
+                "rows_out": _rows(result),
+                "bytes_allocated": None,
+                "new_frames": int(isinstance(result, pd.DataFrame)),
+                "depth": 0,
+                "thread": threading.get_ident(),
+                "pid": os.getpid(),
+            })
+    return wrapper
+
+
+def _rows(df):
+    return len(df) if isinstance(df, pd.DataFrame) else None
+
+
+def _profiled_rows(instance):
+    """
+    Number of data rows accumulated by an instance with a statistics attribute, or None for other instances.
+    """
+    if not hasattr(instance, "statistics"):
+        return None
+    return getattr(instance.statistics, "rows", 0)
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+
+
+class LoanPortfolioAnalytics:
+    """
+    A class for computing loan portfolio metrics from the loan payments schema, overall or per group.
+
+    Every metric is a ratio of sums of vectorized per-loan quantities, so chunks are reduced to
+    per-group sums with update() and accumulators built over different rows combine with merge().
+    Remaining payments are estimated from the term, the months between issue_date and
+    last_payment_date and the monthly instalment.
+
+    Metrics (per group):
+        loans: Number of loans.
+        recovered_percentage: total_payment as a percentage of funded_amount.
+        recovered_percentage_inv: total_payment_inv as a percentage of funded_amount_inv.
+        recovered_ahead_percentage: Percentage of funded_amount recovered after months_ahead more instalments
+            from the loans that are still open (not charged off or fully paid), each capped at the loan's
+            outstanding principal plus the interest accrued on it over those months.
+        charged_off_loans, charged_off_percentage: Number and percentage of charged off loans.
+        charged_off_paid: Amount paid towards the charged off loans before they were charged off.
+        charged_off_projected_loss: Instalments the charged off loans would have paid over the rest of their term.
+        late_loans, late_percentage: Number and percentage of loans with a late status.
+        late_projected_loss: Loss if the late loans were charged off now, i.e. their remaining instalments.
+        at_risk_percentage: Percentage of loans that are charged off or late.
+        at_risk_revenue_percentage: Projected loss of the charged off and late loans as a percentage of
+            the total expected revenue (instalment times term) of all loans.
+
+    Attributes:
+        group_by (list): Columns to group the metrics by, e.g. grade, purpose or loan_status. Empty for the whole book.
+        months_ahead (int): Number of future instalments counted by recovered_ahead_percentage.
+        sums (pd.DataFrame): Accumulated per-group sums.
+
+    Methods:
+        update(df): Add a DataFrame chunk.
+        merge(other): Combine with another LoanPortfolioAnalytics with the same settings.
+        summary(): Get the metrics as a DataFrame with one row per group.
+        analyse(data): Accumulate a DataFrame or an iterable of chunks and return the summary.
+    """
+    CHARGED_OFF = "Charged Off"
+    FULLY_PAID = "Fully Paid"
+    LATE = "Late"
+
+    def __init__(self, group_by=None, months_ahead=6):
+        self.group_by = [group_by] if isinstance(group_by, str) else list(group_by or [])
+        self.months_ahead = months_ahead
+        self.sums = None
+
+    def update(self, df):
+        """
+        Add a DataFrame chunk.
+
+        Args:
+            df (pd.DataFrame): Chunk with the loan payments columns.
+        """
+        term = _term_months(df["term"])
+        elapsed = _month_index(df["last_payment_date"]) - _month_index(df["issue_date"])
+        remaining = np.clip(term - np.nan_to_num(elapsed), 0, term)
+        instalment = df["instalment"].to_numpy(dtype=float, na_value=np.nan)
+        total_payment = df["total_payment"].to_numpy(dtype=float, na_value=np.nan)
+        status = df["loan_status"].astype(str)
+        charged_off = status.str.contains(self.CHARGED_OFF, regex=False).to_numpy()
+        closed = charged_off | status.str.contains(self.FULLY_PAID, regex=False).to_numpy()
+        late = status.str.contains(self.LATE, regex=False).to_numpy()
+        remaining_revenue = instalment * remaining
+        months_ahead = np.minimum(remaining, self.months_ahead)
+        owed_ahead = (
+            df["out_prncp"].to_numpy(dtype=float, na_value=np.nan)
+            * (1 + df["int_rate"].to_numpy(dtype=float, na_value=np.nan) / 1200) ** months_ahead
+        )
+        paid_ahead = np.where(closed, 0.0, np.fmin(instalment * months_ahead, owed_ahead))
+
+        parts = pd.DataFrame({
+            "loans": np.ones(len(df)),
+            "funded_amount": df["funded_amount"].to_numpy(dtype=float, na_value=np.nan),
+            "funded_amount_inv": df["funded_amount_inv"].to_numpy(dtype=float, na_value=np.nan),
+            "total_payment": total_payment,
+            "total_payment_inv": df["total_payment_inv"].to_numpy(dtype=float, na_value=np.nan),
+            "recovered_ahead": total_payment + paid_ahead,
+            "expected_revenue": instalment * term,
+            "charged_off_loans": charged_off.astype(float),
+            "charged_off_paid": np.where(charged_off, total_payment, 0.0),
+            "charged_off_projected_loss": np.where(charged_off, remaining_revenue, 0.0),
+            "late_loans": late.astype(float),
+            "late_projected_loss": np.where(late, remaining_revenue, 0.0),
+        }, index=df.index)
+        if self.group_by:
+            sums = parts.groupby([df[column] for column in self.group_by], observed=True, dropna=False).sum()
+        else:
+            sums = parts.sum().to_frame("all").T
+        self.sums = sums if self.sums is None else self.sums.add(sums, fill_value=0)
+        return self
+
+    def merge(self, other):
+        """
+        Combine with another LoanPortfolioAnalytics with the same settings.
+
+        Args:
+            other (LoanPortfolioAnalytics): Accumulator built over different rows.
+        """
+        if other.sums is not None:
+            self.sums = other.sums.copy() if self.sums is None else self.sums.add(other.sums, fill_value=0)
+        return self
+
+    def summary(self):
+        """
+        Get the metrics as a DataFrame with one row per group.
+
+        Returns:
+            pd.DataFrame: Metrics described in the class docstring.
+        """
+        sums = self.sums
+        with np.errstate(divide='ignore', invalid='ignore'):
+            summary = pd.DataFrame({
+                "loans": sums["loans"].astype(np.int64),
+                "recovered_percentage": sums["total_payment"] / sums["funded_amount"] * 100,
+                "recovered_percentage_inv": sums["total_payment_inv"] / sums["funded_amount_inv"] * 100,
+                "recovered_ahead_percentage": sums["recovered_ahead"] / sums["funded_amount"] * 100,
+                "charged_off_loans": sums["charged_off_loans"].astype(np.int64),
+                "charged_off_percentage": sums["charged_off_loans"] / sums["loans"] * 100,
+                "charged_off_paid": sums["charged_off_paid"],
+                "charged_off_projected_loss": sums["charged_off_projected_loss"],
+                "late_loans": sums["late_loans"].astype(np.int64),
+                "late_percentage": sums["late_loans"] / sums["loans"] * 100,
+                "late_projected_loss": sums["late_projected_loss"],
+                "at_risk_percentage": (sums["charged_off_loans"] + sums["late_loans"]) / sums["loans"] * 100,
+                "at_risk_revenue_percentage": (
+                    (sums["charged_off_projected_loss"] + sums["late_projected_loss"]) / sums["expected_revenue"] * 100
+                ),
+            })
+        return summary
+
+    def analyse(self, data):
+        """
+        Accumulate a DataFrame or an iterable of chunks and return the summary.
+
+        Args:
+            data (pd.DataFrame or iterable): A DataFrame or an iterable of DataFrame chunks.
+
+        Returns:
+            pd.DataFrame: Metrics with one row per group.
+        """
+        for chunk in ([data] if isinstance(data, pd.DataFrame) else data):
+            self.update(chunk)
+        return self.summary()
+
+
+def _term_months(term):
+    """
+    Number of months in the term column, parsing values such as '36 months' once per distinct value.
+    """
+    if pd.api.types.is_numeric_dtype(term):
+        return term.to_numpy(dtype=float, na_value=np.nan)
+    term = term.astype('category')
+    months = pd.to_numeric(term.cat.categories.astype(str).str.extract(r"(\d+)", expand=False), errors='coerce')
+    return np.append(np.asarray(months, dtype=float), np.nan)[term.cat.codes.to_numpy()]
+
+
+def _month_index(dates):
+    """
+    Months since year 0 for a column of dates or 'Jan-2021' style strings, NaN where missing.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format="%b-%Y", errors='coerce')
+    return (dates.dt.year * 12 + dates.dt.month).to_numpy(dtype=float, na_value=np.nan)
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+
+from summary_statistics import MomentAccumulator, QuantileSketch
+
+
+class OutlierDetector:
+    """
+    A class for detecting outliers across several columns with one combined, vectorized mask.
+
+    Bounds are fitted per column with one of three methods:
+        'zscore': mean +/- threshold * std (default threshold 2).
+        'iqr': [Q1 - threshold * IQR, Q3 + threshold * IQR] (default threshold 1.5).
+        'mad': median +/- threshold * 1.4826 * MAD, the modified z-score (default threshold 3.5).
+    A DataFrame is fitted with exact statistics. An iterable of chunks is fitted out of core with
+    mergeable accumulators: exact moments for 'zscore', and quantile sketches with 1% relative
+    error for 'iqr' and 'mad'. 'mad' needs a second pass, so chunks must then be given as a list
+    or as a callable returning a fresh iterator.
+
+    Attributes:
+        columns (list): Columns checked for outliers.
+        method (str): 'zscore', 'iqr' or 'mad'.
+        threshold (float): Multiplier applied to the spread of each column.
+        lower (dict): Lower bound per column.
+        upper (dict): Upper bound per column.
+        rejection_counts (pd.Series): Number of values flagged per column by mask() so far.
+
+    Methods:
+        fit(data): Fit the bounds from a DataFrame or chunks.
+        mask(df): Get a boolean mask of the rows to keep.
+        filter(chunks): Yield each chunk with its outlier rows removed.
+    """
+    DEFAULT_THRESHOLDS = {"zscore": 2, "iqr": 1.5, "mad": 3.5}
+
+    def __init__(self, columns, method="zscore", threshold=None):
+        if method not in self.DEFAULT_THRESHOLDS:
+            raise ValueError(f"Unknown outlier method: {method}")
+        self.columns = [columns] if isinstance(columns, str) else list(columns)
+        self.method = method
+        self.threshold = self.DEFAULT_THRESHOLDS[method] if threshold is None else threshold
+        self.lower = {}
+        self.upper = {}
+        self.rejection_counts = pd.Series(0, index=self.columns, dtype=np.int64)
+
+    def _values(self, df):
+        return df[self.columns].to_numpy(dtype=float, na_value=np.nan)
+
+    def fit(self, data):
+        """
+        Fit the bounds from a DataFrame or chunks.
+
+        Args:
+            data (pd.DataFrame, list or callable): A DataFrame, an iterable of DataFrame chunks,
+                or a callable returning a fresh iterator of chunks.
+
+        Returns:
+            OutlierDetector: The fitted detector.
+        """
+        if isinstance(data, pd.DataFrame):
+            centre, spread, low, high = self._fit_frame(self._values(data))
+        else:
+            centre, spread, low, high = self._fit_chunks(data)
+        if self.method == "iqr":
+            lower, upper = low - self.threshold * (high - low), high + self.threshold * (high - low)
+        else:
+            lower, upper = centre - self.threshold * spread, centre + self.threshold * spread
+        self.lower = dict(zip(self.columns, lower.tolist()))
+        self.upper = dict(zip(self.columns, upper.tolist()))
+        return self
+
+    def _fit_frame(self, values):
+        """
+        Exact centre, spread and quartiles per column of an in-memory array.
+        """
+        centre = spread = low = high = None
+        if self.method == "zscore":
+            centre, spread = np.nanmean(values, axis=0), np.nanstd(values, axis=0)
+        elif self.method == "iqr":
+            low, high = np.nanquantile(values, [0.25, 0.75], axis=0)
+        else:
+            centre = np.nanmedian(values, axis=0)
+            spread = 1.4826 * np.nanmedian(np.abs(values - centre), axis=0)
+        return centre, spread, low, high
+
+    def _fit_chunks(self, chunks):
+        """
+        Centre, spread and quartiles per column accumulated over chunks.
+        """
+        centre = spread = low = high = None
+        if self.method == "mad" and not callable(chunks) and iter(chunks) is chunks:
+            raise ValueError("The 'mad' method needs two passes; pass a list of chunks or a callable returning an iterator.")
+        if self.method == "zscore":
+            moments = MomentAccumulator(len(self.columns))
+            for chunk in self._iterate(chunks):
+                moments.update(self._values(chunk))
+            centre, spread = moments.mean, np.sqrt(moments.m2 / moments.count)
+            return centre, spread, low, high
+
+        sketches = self._sketch(self._iterate(chunks))
+        if self.method == "iqr":
+            low = np.array([sketch.quantile(0.25) for sketch in sketches])
+            high = np.array([sketch.quantile(0.75) for sketch in sketches])
+            return centre, spread, low, high
+
+        centre = np.array([sketch.quantile(0.5) for sketch in sketches])
+        deviations = self._sketch(np.abs(self._values(chunk) - centre) for chunk in self._iterate(chunks))
+        spread = 1.4826 * np.array([sketch.quantile(0.5) for sketch in deviations])
+        return centre, spread, low, high
+
+    def _sketch(self, arrays):
+        """
+        Build one quantile sketch per column from DataFrame chunks or 2-D arrays.
+        """
+        sketches = [QuantileSketch() for _ in self.columns]
+        for values in arrays:
+            if isinstance(values, pd.DataFrame):
+                values = self._values(values)
+            for position, sketch in enumerate(sketches):
+                column_values = values[:, position]
+                sketch.update(column_values[~np.isnan(column_values)])
+        return sketches
+
+    @staticmethod
+    def _iterate(chunks):
+        return chunks() if callable(chunks) else iter(chunks)
+
+    def mask(self, df):
+        """
+        Get a boolean mask of the rows to keep, flagging a row if any column is outside its bounds.
+
+        Missing values are never flagged. Per-column rejection counts are added to rejection_counts.
+
+        Args:
+            df (pd.DataFrame): DataFrame or chunk to check.
+
+        Returns:
+            np.ndarray: True for rows that are not outliers in any column.
+        """
+        values = self._values(df)
+        lower = np.array([self.lower[column] for column in self.columns])
+        upper = np.array([self.upper[column] for column in self.columns])
+        outliers = (values < lower) | (values > upper)
+        self.rejection_counts += outliers.sum(axis=0)
+        return ~outliers.any(axis=1)
+
+    def filter(self, chunks):
+        """
+        Yield each chunk with its outlier rows removed.
+
+        Args:
+            chunks (iterable): Iterable of DataFrame chunks.
+
+        Yields:
+            pd.DataFrame: The rows of the chunk that are not outliers.
+        """
+        for chunk in chunks:
+            yield chunk[self.mask(chunk)]
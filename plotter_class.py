@@ -1,94 +1,159 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from statsmodels.graphics.gofplots import qqplot
 
+from correlation import CorrelationEngine
+from instrumentation import instrumented
+
+@instrumented
 class Plotter:
     """
     A class for creating various plots and visualizations based on a Pandas DataFrame.
 
     Attributes:
         df (pd.DataFrame): The input Pandas DataFrame.
+        max_points (int, optional): Number of rows above which histograms and KDEs are drawn from
+            pre-binned counts instead of raw rows. If None, raw rows are always used.
+        bins (int): Number of bins used by the binned path; more bins give a more accurate plot.
+        cache (ResultCache, optional): Cache reusing correlation matrices computed on unchanged data.
 
     Methods:
-        discrete_probability_distribution(column_to_plot): Plot a discrete probability distribution for a specified column.
-        histogram(column_to_plot): Plot a histogram for a specified column.
-        box_plot(column_to_plot): Plot a box plot for a specified column.
-        qq_plot(column_to_plot): Plot a Q-Q plot for a specified column.
-        kde_plot(column_to_plot): Plot a Kernel Density Estimate (KDE) plot for a specified column.
-        compare_distributions(column_to_plot, original_df, transformed_df): Compare the distributions of a column before and after transformation.
-        kde_hist_multi(columns_to_plot): Plot multiple KDE histograms for specified columns.
-        correlation_heatmap(columns_to_plot, mask_upper=True, cmap='coolwarm'): Plot a correlation heatmap for specified columns.
+        discrete_probability_distribution(column_to_plot, save_path=None): Plot a discrete probability distribution for a specified column.
+        histogram(column_to_plot, save_path=None): Plot a histogram for a specified column.
+        box_plot(column_to_plot, save_path=None): Plot a box plot for a specified column.
+        qq_plot(column_to_plot, save_path=None): Plot a Q-Q plot for a specified column.
+        kde_plot(column_to_plot, save_path=None): Plot a Kernel Density Estimate (KDE) plot for a specified column.
+        compare_distributions(column_to_plot, original_df, transformed_df, save_path=None): Compare the distributions of a column before and after transformation.
+        kde_hist_multi(columns_to_plot, save_path=None): Plot multiple KDE histograms for specified columns.
+        correlation_heatmap(columns_to_plot, mask_upper=True, cmap='coolwarm', save_path=None): Plot a correlation heatmap for specified columns.
 
     """
-    def __init__(self, dataframe):
+    def __init__(self, dataframe, max_points=None, bins=256, cache=None):
         self.df = dataframe
+        self.max_points = max_points
+        self.bins = bins
+        self.cache = cache
+
+    def _show(self, save_path=None):
+        """
+        Show the current figure, or save it to save_path and close it when running headless.
+        """
+        plt, _ = _plotting()
+        if save_path:
+            plt.savefig(save_path, bbox_inches='tight')
+            plt.close('all')
+        else:
+            plt.show()
+
+    def _use_binned(self, data_frame, column):
+        """
+        Check whether a column should be plotted from binned counts.
+        """
+        return self.max_points is not None and data_frame[column].count() > self.max_points
+
+    def _binned_histplot(self, values, ax=None, kde=True):
+        """
+        Plot a histogram, and optionally a KDE, from NumPy-binned counts rather than raw values.
+
+        Args:
+            values (pd.Series): Values to plot.
+            ax (matplotlib.axes.Axes, optional): Axes to draw on. Defaults to the current axes.
+            kde (bool): Whether to overlay a binned KDE.
+        """
+        plt, sns = _plotting()
+        ax = ax or plt.gca()
+        counts, edges = np.histogram(values.dropna().to_numpy(dtype=float), bins=self.bins)
+        centres = (edges[:-1] + edges[1:]) / 2
+        binned = pd.DataFrame({values.name: centres, 'count': counts})
+        sns.histplot(data=binned, x=values.name, weights='count', bins=len(counts), binrange=(edges[0], edges[-1]), ax=ax)
+        if kde:
+            density = _binned_kde(counts, edges)
+            ax.plot(centres, density * counts.sum() * (edges[1] - edges[0]))
     
-    def discrete_probability_distribution(self, column_to_plot):
+    def discrete_probability_distribution(self, column_to_plot, save_path=None):
         """
         Plot a discrete probability distribution for a specified column.
 
         Args:
             column_to_plot (str): Name of the column to be plotted.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
+        plt, sns = _plotting()
         plt.rc("axes.spines", top=False, right=False)
         probs = self.df[column_to_plot].value_counts(normalize=True)
         dpd=sns.barplot(y=probs.index, x=probs.values, color='b')
         plt.xlabel('Values')
         plt.ylabel('Probability')
         plt.title('Discrete Probability Distribution')
-        plt.show()
+        self._show(save_path)
 
-    def histogram(self, column_to_plot):
+    def histogram(self, column_to_plot, save_path=None):
         """
         Plot a histogram for a specified column.
 
         Args:
             column_to_plot (str): Name of the column to be plotted.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
-        sns.histplot(data=self.df, x=column_to_plot, kde=True)
+        plt, sns = _plotting()
+        if self._use_binned(self.df, column_to_plot):
+            self._binned_histplot(self.df[column_to_plot])
+        else:
+            sns.histplot(data=self.df, x=column_to_plot, kde=True)
         sns.despine()
         plt.title('Histogram')
-        plt.show()
+        self._show(save_path)
 
-    def box_plot(self, column_to_plot):
+    def box_plot(self, column_to_plot, save_path=None):
         """
         Plot a box plot for a specified column.
 
         Args:
             column_to_plot (str): Name of the column to be plotted.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
+        plt, sns = _plotting()
         sns.boxplot(x=self.df[column_to_plot])
         plt.title('Box Plot')
         plt.xlabel(column_to_plot)
-        plt.show()
+        self._show(save_path)
 
-    def qq_plot(self, column_to_plot):
+    def qq_plot(self, column_to_plot, save_path=None):
         """
         Plot a Q-Q plot for a specified column.
 
         Args:
             column_to_plot (str): Name of the column to be plotted.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
+        from statsmodels.graphics.gofplots import qqplot
+        plt, _ = _plotting()
         qqplot(self.df[column_to_plot], line='s')
         plt.title('Q-Q Plot')
-        plt.show()
+        self._show(save_path)
 
-    def kde_plot(self, column_to_plot):
+    def kde_plot(self, column_to_plot, save_path=None):
         """
         Plot a Kernel Density Estimate (KDE) plot for a specified column.
 
         Args:
             column_to_plot (str): Name of the column to be plotted.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
-        sns.kdeplot(data=self.df[column_to_plot], shade=True)
+        plt, sns = _plotting()
+        if self._use_binned(self.df, column_to_plot):
+            counts, edges = np.histogram(self.df[column_to_plot].dropna().to_numpy(dtype=float), bins=self.bins)
+            centres = (edges[:-1] + edges[1:]) / 2
+            density = _binned_kde(counts, edges)
+            plt.plot(centres, density)
+            plt.fill_between(centres, density, alpha=0.25)
+        else:
+            sns.kdeplot(data=self.df[column_to_plot], shade=True)
         plt.title('Kernel Density Estimate Plot')
         plt.xlabel(column_to_plot)
         plt.ylabel('Density')
-        plt.show()
+        self._show(save_path)
 
-    def compare_distributions(self, column_to_plot, original_df, transformed_df):
+    def compare_distributions(self, column_to_plot, original_df, transformed_df, save_path=None):
         """
         Compare the distributions of a column before and after transformation.
 
@@ -96,33 +161,57 @@ class Plotter:
             column_to_plot (str): Name of the column to be compared.
             original_df (pd.DataFrame): Original DataFrame before transformation.
             transformed_df (pd.DataFrame): Transformed DataFrame after transformation.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
+        plt, sns = _plotting()
         plt.figure(figsize=(12, 6))
         
         plt.subplot(1, 2, 1)
-        sns.histplot(data=original_df, x=column_to_plot, kde=True)
+        if self._use_binned(original_df, column_to_plot):
+            self._binned_histplot(original_df[column_to_plot])
+        else:
+            sns.histplot(data=original_df, x=column_to_plot, kde=True)
         plt.title(f'Distribution of {column_to_plot} (Before)')
         
         plt.subplot(1, 2, 2)
-        sns.histplot(data=transformed_df, x=column_to_plot, kde=True)
+        if self._use_binned(transformed_df, column_to_plot):
+            self._binned_histplot(transformed_df[column_to_plot])
+        else:
+            sns.histplot(data=transformed_df, x=column_to_plot, kde=True)
         plt.title(f'Distribution of {column_to_plot} (After)')
 
         plt.tight_layout()
-        plt.show()
+        self._show(save_path)
 
-    def kde_hist_multi(self, columns_to_plot):
+    def kde_hist_multi(self, columns_to_plot, save_path=None):
         """
         Plot multiple KDE histograms for specified columns.
 
         Args:
             columns_to_plot (list): List of column names to be plotted.
+            save_path (str, optional): File to save the figure to instead of showing it.
         """
+        plt, sns = _plotting()
         sns.set(font_scale=0.7)
+        if any(self._use_binned(self.df, column) for column in columns_to_plot):
+            n_rows = -(-len(columns_to_plot) // 3)
+            fig, axes = plt.subplots(n_rows, 3, figsize=(12, 4 * n_rows), squeeze=False)
+            for ax, column in zip(axes.flat, columns_to_plot):
+                self._binned_histplot(self.df[column], ax=ax)
+                ax.set_title(f'variable = {column}')
+            for ax in axes.flat[len(columns_to_plot):]:
+                ax.set_visible(False)
+            plt.tight_layout()
+            if save_path:
+                self._show(save_path)
+            return
         f = pd.melt(self.df, value_vars=columns_to_plot)
         g = sns.FacetGrid(f, col="variable",  col_wrap=3, sharex=False, sharey=False)
         g = g.map(sns.histplot, "value", kde=True)
+        if save_path:
+            self._show(save_path)
 
-    def correlation_heatmap(self, columns_to_plot, mask_upper=True, cmap='coolwarm'):
+    def correlation_heatmap(self, columns_to_plot, mask_upper=True, cmap='coolwarm', save_path=None, correlation_matrix=None, annot=None):
         """
         Plot a correlation heatmap for specified columns.
 
@@ -130,10 +219,22 @@ class Plotter:
             columns_to_plot (list): List of column names to be included in the heatmap.
             mask_upper (bool): Whether to mask the upper triangle of the heatmap. Default is True.
             cmap (str): Colormap for the heatmap. Default is 'coolwarm'.
+            save_path (str, optional): File to save the figure to instead of showing it.
+            correlation_matrix (pd.DataFrame, optional): Precomputed matrix, e.g. from CorrelationEngine.
+                If given, the data is not read and columns_to_plot selects rows and columns of the matrix.
+            annot (bool, optional): Whether to write the values in the cells. Defaults to True for up to 15 columns.
         """
-        subset_df = self.df[columns_to_plot]
-
-        correlation_matrix = subset_df.corr()
+        plt, sns = _plotting()
+        if correlation_matrix is not None:
+            correlation_matrix = correlation_matrix.loc[columns_to_plot, columns_to_plot]
+        elif self.cache is None:
+            correlation_matrix = CorrelationEngine(columns_to_plot).compute(self.df)
+        else:
+            correlation_matrix = self.cache.get_or_compute(
+                'correlation_heatmap', self.df, columns_to_plot, lambda: CorrelationEngine(columns_to_plot).compute(self.df)
+            )
+        if annot is None:
+            annot = len(correlation_matrix) <= 15
 
         if mask_upper:
             mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))
@@ -141,7 +242,49 @@ class Plotter:
             mask = None
 
         plt.figure(figsize=(10, 8))
-        sns.heatmap(correlation_matrix, mask=mask, square=True, linewidths=.5, annot=True, cmap=cmap)
+        sns.heatmap(correlation_matrix, mask=mask, square=True, linewidths=.5, annot=annot, cmap=cmap)
         plt.yticks(rotation=0)
         plt.title('Correlation Matrix of Specified Columns')
-        plt.show()
\ No newline at end of file
+        self._show(save_path)
+
+
+def _binned_kde(counts, edges):
+    """
+    Estimate a Gaussian KDE on a regular grid from binned counts using an FFT convolution.
+
+    The bandwidth follows Scott's rule computed from the binned data, so the cost depends on
+    the number of bins rather than the number of rows.
+
+    Args:
+        counts (np.ndarray): Histogram counts.
+        edges (np.ndarray): Equally spaced bin edges.
+
+    Returns:
+        np.ndarray: Density at each bin centre.
+    """
+    from scipy.signal import fftconvolve
+    centres = (edges[:-1] + edges[1:]) / 2
+    total = counts.sum()
+    if total == 0:
+        return np.zeros(len(counts))
+    mean = np.sum(counts * centres) / total
+    std = np.sqrt(np.sum(counts * (centres - mean) ** 2) / total)
+    bin_width = edges[1] - edges[0]
+    bandwidth = max(std * total ** (-1 / 5), bin_width)
+    half_width = min(len(counts), int(np.ceil(4 * bandwidth / bin_width)))
+    offsets = np.arange(-half_width, half_width + 1) * bin_width
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    density = fftconvolve(counts, kernel, mode='same')
+    return np.clip(density, 0, None) / (total * bandwidth * np.sqrt(2 * np.pi))
+
+
+def _plotting():
+    """
+    Import matplotlib and seaborn on first use, so importing this module does not load the plotting stack.
+
+    Returns:
+        tuple: The matplotlib.pyplot and seaborn modules.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
@@ -0,0 +1,110 @@
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from instrumentation import status
+from plotter_class import Plotter
+
+_worker_plotter = None
+
+
+class ReportGenerator:
+    """
+    A class for rendering a batch EDA report headlessly, with figures drawn in a process pool.
+
+    Each configured plot is drawn for each column with the non-interactive Agg backend and
+    written to the output directory, together with an index.html page linking every figure.
+
+    Attributes:
+        df (pd.DataFrame): The input Pandas DataFrame.
+        output_dir (str): Directory the figures and index page are written to.
+        columns (list): Columns to plot. Defaults to all numeric columns.
+        plots (list): Names of the single-column Plotter methods to run per column, from COLUMN_PLOTS.
+        correlation (bool): Whether to add a correlation heatmap of all columns.
+        file_format (str): Figure file format, 'png' or 'svg'.
+        max_workers (int, optional): Maximum number of worker processes.
+        max_points (int, optional): Passed to Plotter to draw large columns from binned counts.
+
+    Methods:
+        generate(): Render every figure and write the index page.
+    """
+    COLUMN_PLOTS = ("histogram", "box_plot", "qq_plot", "kde_plot", "discrete_probability_distribution")
+
+    def __init__(self, df, output_dir="report", columns=None, plots=("histogram", "box_plot", "qq_plot"),
+                 correlation=True, file_format="png", max_workers=None, max_points=None):
+        self.df = df
+        self.output_dir = output_dir
+        self.columns = list(columns) if columns else list(df.select_dtypes('number').columns)
+        self.plots = list(plots)
+        self.correlation = correlation
+        self.file_format = file_format
+        self.max_workers = max_workers
+        self.max_points = max_points
+        for plot in self.plots:
+            if plot not in self.COLUMN_PLOTS:
+                raise ValueError(f"Unknown plot: {plot}")
+
+    def generate(self):
+        """
+        Render every figure in a process pool and write the index page.
+
+        Returns:
+            str: Path to the index.html page.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        tasks = [
+            (plot, column, os.path.join(self.output_dir, f"{column}_{plot}.{self.file_format}"))
+            for column in self.columns for plot in self.plots
+        ]
+        if self.correlation:
+            tasks.append(("correlation_heatmap", self.columns, os.path.join(self.output_dir, f"correlation_heatmap.{self.file_format}")))
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_initialise_worker, initargs=(self.df[self.columns], self.max_points)
+        ) as pool:
+            list(pool.map(_render_figure, tasks))
+        index_path = self._write_index(tasks)
+        status(f"Report written to {index_path}.")
+        return index_path
+
+    def _write_index(self, tasks):
+        """
+        Write an index.html page linking every rendered figure, grouped by column.
+        """
+        sections = []
+        for column in self.columns:
+            images = "".join(
+                f'<img src="{html.escape(os.path.basename(path))}" alt="{html.escape(plot)}">'
+                for plot, task_column, path in tasks if task_column == column
+            )
+            sections.append(f"<h2>{html.escape(str(column))}</h2>\n<div>{images}</div>")
+        if self.correlation:
+            sections.append(f'<h2>Correlation</h2>\n<div><img src="correlation_heatmap.{self.file_format}" alt="correlation_heatmap"></div>')
+        index_path = os.path.join(self.output_dir, "index.html")
+        with open(index_path, "w") as file:
+            file.write(
+                "<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>EDA Report</title>"
+                "<style>img { max-width: 32%; margin: 0.5%; }</style></head>\n<body>\n<h1>EDA Report</h1>\n"
+                + "\n".join(sections) + "\n</body>\n</html>\n"
+            )
+        return index_path
+
+
+def _initialise_worker(df, max_points):
+    """
+    Worker initialiser: switch to the Agg backend and build the Plotter once per process.
+    """
+    global _worker_plotter
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+    _worker_plotter = Plotter(df, max_points=max_points)
+
+
+def _render_figure(task):
+    """
+    Worker entry point: draw one figure and save it.
+    """
+    import matplotlib.pyplot as plt
+    plot, column, path = task
+    getattr(_worker_plotter, plot)(column, save_path=path)
+    plt.close('all')
+    return path
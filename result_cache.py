@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+class ResultCache:
+    """
+    A content-addressed cache for statistics and plot data computed from DataFrame columns.
+
+    Entries are keyed on a hash of the relevant columns' data plus the method name and its
+    arguments, so a result is reused whenever the same computation is repeated on unchanged
+    data. Results are pickled to cache_dir, which is trimmed to max_bytes by evicting the least
+    recently used files, and the pickled bytes are also kept in an in-memory LRU. Every hit
+    unpickles a fresh copy, so callers may modify returned results without corrupting the cache.
+
+    Attributes:
+        cache_dir (str): Directory the cached results are written to.
+        max_bytes (int): Maximum total size of the cached files.
+        max_memory_entries (int): Maximum number of results kept in memory.
+
+    Methods:
+        key(method, df, columns, *args, **kwargs): Build the cache key for a computation.
+        get_or_compute(method, df, columns, compute, *args, **kwargs): Return a cached result or compute and store it.
+        invalidate(columns=None): Remove cached results that depend on any of the columns.
+        clear(): Remove all cached results.
+    """
+    def __init__(self, cache_dir=".eda_cache", max_bytes=256 * 1024 ** 2, max_memory_entries=128):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._index = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r") as file:
+                self._index = json.load(file)
+
+    @staticmethod
+    def column_hash(series):
+        """
+        Hash the data of a column.
+
+        Numeric, datetime and categorical code buffers are hashed directly; other dtypes are hashed value by value.
+
+        Args:
+            series (pd.Series): Column to hash.
+
+        Returns:
+            str: Hex digest of the column's name, dtype and values.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{series.name}|{series.dtype}|{len(series)}".encode())
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            digest.update(pd.util.hash_array(series.cat.categories.to_numpy()).tobytes())
+            values = series.cat.codes.to_numpy()
+        else:
+            values = series.to_numpy()
+        if values.dtype.kind in "biufcmM":
+            digest.update(np.ascontiguousarray(values).view(np.uint8))
+        else:
+            digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def key(self, method, df, columns, *args, **kwargs):
+        """
+        Build the cache key for a computation.
+
+        Args:
+            method (str): Name of the computation.
+            df (pd.DataFrame): DataFrame holding the columns.
+            columns (list): Columns the computation reads.
+            *args, **kwargs: Arguments that change the result.
+
+        Returns:
+            str: Hex digest identifying the computation and its input data.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{method}|{args!r}|{sorted(kwargs.items())!r}".encode())
+        for column in columns:
+            digest.update(self.column_hash(df[column]).encode())
+        return digest.hexdigest()
+
+    def get_or_compute(self, method, df, columns, compute, *args, **kwargs):
+        """
+        Return a cached result, or compute it and store it.
+
+        Args:
+            method (str): Name of the computation.
+            df (pd.DataFrame): DataFrame holding the columns.
+            columns (list): Columns the computation reads; None means all columns.
+            compute (callable): Called without arguments to compute the result on a cache miss.
+            *args, **kwargs: Arguments that change the result.
+
+        Returns:
+            The cached or newly computed result.
+        """
+        columns = list(df.columns) if columns is None else ([columns] if isinstance(columns, str) else list(columns))
+        key = self.key(method, df, columns, *args, **kwargs)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return pickle.loads(self._memory[key])
+        path = os.path.join(self.cache_dir, f"{key}.pkl")
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                data = file.read()
+            result = pickle.loads(data)
+            os.utime(path)
+        else:
+            result = compute()
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(path, "wb") as file:
+                file.write(data)
+            self._index[key] = [str(column) for column in columns]
+            self._evict()
+            self._save_index()
+        self._remember(key, data)
+        return result
+
+    def invalidate(self, columns=None):
+        """
+        Remove cached results that depend on any of the columns.
+
+        Args:
+            columns (list, optional): Column names. If None, removes all cached results.
+        """
+        if columns is None:
+            self.clear()
+            return
+        names = {str(column) for column in ([columns] if isinstance(columns, str) else columns)}
+        stale = [key for key, key_columns in self._index.items() if names & set(key_columns)]
+        for key in stale:
+            self._remove(key)
+        if stale:
+            self._save_index()
+
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+        for key in list(self._index):
+            self._remove(key)
+        self._memory.clear()
+        self._save_index()
+
+    def _remember(self, key, data):
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _remove(self, key):
+        self._memory.pop(key, None)
+        self._index.pop(key, None)
+        path = os.path.join(self.cache_dir, f"{key}.pkl")
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _evict(self):
+        entries = []
+        for key in list(self._index):
+            path = os.path.join(self.cache_dir, f"{key}.pkl")
+            if not os.path.exists(path):
+                self._index.pop(key)
+                continue
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, key))
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def _save_index(self):
+        with open(self._index_path, "w") as file:
+            json.dump(self._index, file)
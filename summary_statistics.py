@@ -0,0 +1,464 @@
+import numpy as np
+import pandas as pd
+
+
+class MomentAccumulator:
+    """
+    A class for accumulating count, mean, variance, skewness, min and max of numeric columns in one pass.
+
+    Central moments are combined with the pairwise update formulas of Chan et al. and Pébay,
+    so accumulators built over separate chunks or processes merge exactly.
+
+    Attributes:
+        count (np.ndarray): Number of non-null values per column.
+        mean (np.ndarray): Running mean per column.
+        m2 (np.ndarray): Running sum of squared deviations from the mean per column.
+        m3 (np.ndarray): Running sum of cubed deviations from the mean per column.
+        minimum (np.ndarray): Running minimum per column.
+        maximum (np.ndarray): Running maximum per column.
+
+    Methods:
+        update(values): Add a 2-D array of values (rows by columns, NaN for missing).
+        merge(other): Combine with another MomentAccumulator over the same columns.
+        select(positions): Get a MomentAccumulator over a subset of the columns.
+        variance(): Sample variance per column.
+        skew(): Bias-corrected sample skewness per column, as returned by pd.DataFrame.skew().
+    """
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.m3 = np.zeros(n_columns)
+        self.minimum = np.full(n_columns, np.inf)
+        self.maximum = np.full(n_columns, -np.inf)
+
+    def update(self, values):
+        """
+        Add a 2-D array of values (rows by columns, NaN for missing).
+
+        Args:
+            values (np.ndarray): Float array with one column per accumulated column.
+        """
+        present = ~np.isnan(values)
+        chunk = MomentAccumulator(values.shape[1])
+        chunk.count = present.sum(axis=0).astype(float)
+        filled = np.where(present, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            chunk.mean = np.where(chunk.count > 0, filled.sum(axis=0) / chunk.count, 0.0)
+        deviations = np.where(present, values - chunk.mean, 0.0)
+        chunk.m2 = (deviations ** 2).sum(axis=0)
+        chunk.m3 = (deviations ** 3).sum(axis=0)
+        chunk.minimum = np.where(present, values, np.inf).min(axis=0, initial=np.inf)
+        chunk.maximum = np.where(present, values, -np.inf).max(axis=0, initial=-np.inf)
+        self.merge(chunk)
+        return self
+
+    def merge(self, other):
+        """
+        Combine with another MomentAccumulator over the same columns.
+
+        Args:
+            other (MomentAccumulator): Accumulator built over different rows.
+        """
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = other.mean - self.mean
+            mean = np.where(n > 0, self.mean + delta * n_b / n, 0.0)
+            m2 = self.m2 + other.m2 + np.where(n > 0, delta ** 2 * n_a * n_b / n, 0.0)
+            m3 = (
+                self.m3 + other.m3
+                + np.where(n > 0, delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2, 0.0)
+                + np.where(n > 0, 3 * delta * (n_a * other.m2 - n_b * self.m2) / n, 0.0)
+            )
+        self.count, self.mean, self.m2, self.m3 = n, mean, m2, m3
+        self.minimum = np.minimum(self.minimum, other.minimum)
+        self.maximum = np.maximum(self.maximum, other.maximum)
+        return self
+
+    def select(self, positions):
+        """
+        Get a MomentAccumulator over a subset of the columns.
+
+        Args:
+            positions (list): Positions of the columns to keep.
+
+        Returns:
+            MomentAccumulator: Accumulator holding only the selected columns.
+        """
+        selected = MomentAccumulator(len(positions))
+        for name in ('count', 'mean', 'm2', 'm3', 'minimum', 'maximum'):
+            setattr(selected, name, getattr(self, name)[positions])
+        return selected
+
+    def variance(self):
+        """
+        Sample variance (ddof=1) per column.
+
+        Returns:
+            np.ndarray: Variance per column, NaN where fewer than two values were seen.
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+
+    def skew(self):
+        """
+        Bias-corrected sample skewness per column, as returned by pd.DataFrame.skew().
+
+        Returns:
+            np.ndarray: Skewness per column, NaN where fewer than three values were seen.
+        """
+        n = self.count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            m2, m3 = self.m2 / n, self.m3 / n
+            result = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+            return np.where((n > 2) & (m2 > 0), result, np.where(n > 2, 0.0, np.nan))
+
+
+class QuantileSketch:
+    """
+    A mergeable quantile sketch with a guaranteed relative error (DDSketch).
+
+    Values are counted in logarithmically sized buckets, so any quantile is returned within
+    relative_accuracy of the true value and two sketches merge exactly by adding bucket counts.
+
+    Attributes:
+        relative_accuracy (float): Maximum relative error of returned quantiles.
+        positive (dict): Bucket counts for positive values.
+        negative (dict): Bucket counts for the magnitudes of negative values.
+        zero_count (int): Number of zero values.
+
+    Methods:
+        update(values): Add a 1-D array of non-null values.
+        merge(other): Combine with another QuantileSketch with the same relative_accuracy.
+        quantile(q): Estimate a quantile.
+        rank(values): Estimate the mid-rank fraction of each value.
+    """
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+
+    def _add(self, store, magnitudes):
+        if len(magnitudes) == 0:
+            return
+        indices = np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+        offset = indices.min()
+        counts = np.bincount(indices - offset)
+        for index in np.flatnonzero(counts):
+            key = int(index + offset)
+            store[key] = store.get(key, 0) + int(counts[index])
+
+    def update(self, values):
+        """
+        Add a 1-D array of non-null values.
+
+        Args:
+            values (np.ndarray): Values to add.
+        """
+        values = np.asarray(values, dtype=float)
+        self._add(self.positive, values[values > 0])
+        self._add(self.negative, -values[values < 0])
+        self.zero_count += int((values == 0).sum())
+        return self
+
+    def merge(self, other):
+        """
+        Combine with another QuantileSketch with the same relative_accuracy.
+
+        Args:
+            other (QuantileSketch): Sketch built over different values.
+        """
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zero_count += other.zero_count
+        return self
+
+    def quantile(self, q):
+        """
+        Estimate a quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Estimated quantile, NaN if the sketch is empty.
+        """
+        total = sum(self.negative.values()) + self.zero_count + sum(self.positive.values())
+        if total == 0:
+            return np.nan
+        rank = q * (total - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -2 * self.gamma ** key / (self.gamma + 1)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.positive) / (self.gamma + 1)
+
+    def rank(self, values):
+        """
+        Estimate the mid-rank fraction of each value, i.e. the share of sketched values below it
+        plus half the share in its bucket. Values in the same bucket get the same rank, so the
+        rank error is not bounded: it is up to half the share of values in the value's bucket.
+
+        Args:
+            values (np.ndarray): Values to rank.
+
+        Returns:
+            np.ndarray: Fractions between 0 and 1, NaN where the value is NaN.
+        """
+        negative_keys = sorted(self.negative, reverse=True)
+        positive_keys = sorted(self.positive)
+        counts = np.array(
+            [self.negative[key] for key in negative_keys] + [self.zero_count] + [self.positive[key] for key in positive_keys],
+            dtype=float
+        )
+        total = counts.sum()
+        if total == 0:
+            return np.full(np.shape(values), np.nan)
+        mid_ranks = (np.cumsum(counts) - counts / 2) / total
+        values = np.asarray(values, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            keys = np.ceil(np.log(np.abs(values)) / self.log_gamma)
+        # Order buckets along the number line: negative buckets by descending key, then zero, then positive.
+        bucket_order = np.concatenate([-np.array(negative_keys, dtype=float) - 1e9, [0.0], np.array(positive_keys, dtype=float) + 1e9])
+        positions = np.where(values > 0, keys + 1e9, np.where(values < 0, -keys - 1e9, 0.0))
+        index = np.clip(np.searchsorted(bucket_order, positions), 0, len(counts) - 1)
+        return np.where(np.isnan(values), np.nan, mid_ranks[index])
+
+
+class DistinctCounter:
+    """
+    A mergeable approximate distinct counter (HyperLogLog).
+
+    Attributes:
+        precision (int): Number of hash bits used to pick a register; 2**precision registers are kept.
+        registers (np.ndarray): Maximum observed rank per register.
+
+    Methods:
+        update(series): Add the non-null values of a Pandas Series.
+        merge(other): Combine with another DistinctCounter with the same precision.
+        estimate(): Estimated number of distinct values.
+        standard_error(): Relative standard error of estimate().
+    """
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, series):
+        """
+        Add the non-null values of a Pandas Series.
+
+        Args:
+            series (pd.Series): Values to add.
+        """
+        series = series.dropna()
+        if series.empty:
+            return self
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        registers = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        remaining = hashes << np.uint64(self.precision)
+        _, bit_length = np.frexp(remaining.astype(float))
+        ranks = np.minimum(64 - bit_length + 1, 64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registers, registers, ranks)
+        return self
+
+    def merge(self, other):
+        """
+        Combine with another DistinctCounter with the same precision.
+
+        Args:
+            other (DistinctCounter): Counter built over different values.
+        """
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """
+        Estimated number of distinct values.
+
+        Returns:
+            float: Estimated distinct count.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m ** 2 / np.sum(2.0 ** -self.registers.astype(float))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros > 0:
+            return m * np.log(m / zeros)
+        return raw
+
+    def standard_error(self):
+        """
+        Relative standard error of estimate().
+
+        Returns:
+            float: Relative standard error, 1.04 / sqrt(number of registers).
+        """
+        return 1.04 / np.sqrt(len(self.registers))
+
+
+class StatisticsAccumulator:
+    """
+    A class for computing mergeable summary statistics for every column of a Pandas DataFrame in one pass.
+
+    Count, null count, mean, variance, skewness, min and max are exact and merge exactly;
+    quantiles are within relative_accuracy of the true value; distinct counts are
+    HyperLogLog estimates with the relative standard error given by distinct_standard_error().
+
+    Numeric columns are taken from the first chunk, or from dtypes when given. Chunks read from
+    CSV files or database cursors can disagree: a text column that is all null in the first
+    chunk is read as float64. A numeric column whose later values cannot be parsed as numbers
+    is therefore moved out of numeric_columns and only keeps its counts and distinct values.
+
+    Attributes:
+        dtypes (dict, optional): Mapping of column names to dtypes applied to every chunk.
+        columns (list): Accumulated column names, set by the first update.
+        numeric_columns (list): Columns with numeric moments and quantiles.
+        rows (int): Number of rows seen.
+        null_counts (np.ndarray): Number of null values per column.
+        moments (MomentAccumulator): Moments of the numeric columns.
+        sketches (dict): QuantileSketch per numeric column.
+        distinct (dict): DistinctCounter per column.
+
+    Methods:
+        update(df): Add a DataFrame chunk.
+        merge(other): Combine with another StatisticsAccumulator over the same columns.
+        summary(quantiles=(0.25, 0.5, 0.75)): Get the statistics as a DataFrame with one row per column.
+        distinct_standard_error(): Relative standard error of the distinct counts.
+    """
+    def __init__(self, relative_accuracy=0.01, precision=14, dtypes=None):
+        self.relative_accuracy = relative_accuracy
+        self.precision = precision
+        self.dtypes = dtypes
+        self.columns = None
+        self.numeric_columns = None
+        self.rows = 0
+        self.null_counts = None
+        self.moments = None
+        self.sketches = {}
+        self.distinct = {}
+
+    def _initialise(self, df):
+        self.columns = list(df.columns)
+        self.numeric_columns = [
+            column for column in self.columns
+            if pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_bool_dtype(df[column])
+        ]
+        self.null_counts = np.zeros(len(self.columns), dtype=np.int64)
+        self.moments = MomentAccumulator(len(self.numeric_columns))
+        self.sketches = {column: QuantileSketch(self.relative_accuracy) for column in self.numeric_columns}
+        self.distinct = {column: DistinctCounter(self.precision) for column in self.columns}
+
+    def update(self, df):
+        """
+        Add a DataFrame chunk.
+
+        Args:
+            df (pd.DataFrame): Chunk with the same columns as previous chunks.
+        """
+        if self.dtypes:
+            df = df.astype({column: dtype for column, dtype in self.dtypes.items() if column in df.columns})
+        if self.columns is None:
+            self._initialise(df)
+        df = df[self.columns]
+        self.rows += len(df)
+        self.null_counts += df.isnull().sum().to_numpy()
+        numeric = {}
+        for column in self.numeric_columns:
+            series = df[column]
+            if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+                series = pd.to_numeric(series, errors='coerce')
+                if series.isnull().sum() > df[column].isnull().sum():
+                    continue
+            numeric[column] = series
+        self._demote([column for column in self.numeric_columns if column not in numeric])
+        values = pd.DataFrame(numeric, index=df.index, columns=self.numeric_columns).to_numpy(dtype=float, na_value=np.nan)
+        self.moments.update(values)
+        for position, column in enumerate(self.numeric_columns):
+            column_values = values[:, position]
+            self.sketches[column].update(column_values[~np.isnan(column_values)])
+        for column in self.columns:
+            self.distinct[column].update(df[column])
+        return self
+
+    def merge(self, other):
+        """
+        Combine with another StatisticsAccumulator over the same columns.
+
+        Args:
+            other (StatisticsAccumulator): Accumulator built over different rows.
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.__dict__.update(other.__dict__)
+            return self
+        self._demote([column for column in self.numeric_columns if column not in other.numeric_columns])
+        positions = [other.numeric_columns.index(column) for column in self.numeric_columns]
+        self.rows += other.rows
+        self.null_counts += other.null_counts
+        self.moments.merge(other.moments.select(positions))
+        for column in self.numeric_columns:
+            self.sketches[column].merge(other.sketches[column])
+        for column in self.columns:
+            self.distinct[column].merge(other.distinct[column])
+        return self
+
+    def _demote(self, columns):
+        """
+        Stop accumulating moments and quantiles for columns that turned out not to be numeric.
+        """
+        if not columns:
+            return
+        kept = [position for position, column in enumerate(self.numeric_columns) if column not in columns]
+        self.moments = self.moments.select(kept)
+        self.numeric_columns = [self.numeric_columns[position] for position in kept]
+        for column in columns:
+            self.sketches.pop(column, None)
+
+    def summary(self, quantiles=(0.25, 0.5, 0.75)):
+        """
+        Get the statistics as a DataFrame with one row per column.
+
+        Args:
+            quantiles (tuple): Quantiles to estimate for numeric columns.
+
+        Returns:
+            pd.DataFrame: Count, null count, mean, variance, std, skew, min, quantiles, max and distinct count per column.
+        """
+        summary = pd.DataFrame(index=pd.Index(self.columns))
+        summary['count'] = self.rows - self.null_counts
+        summary['null_count'] = self.null_counts
+        numeric = self.numeric_columns
+        has_values = self.moments.count > 0
+        summary.loc[numeric, 'mean'] = np.where(has_values, self.moments.mean, np.nan)
+        summary.loc[numeric, 'variance'] = self.moments.variance()
+        summary.loc[numeric, 'std'] = np.sqrt(self.moments.variance())
+        summary.loc[numeric, 'skew'] = self.moments.skew()
+        summary.loc[numeric, 'min'] = np.where(has_values, self.moments.minimum, np.nan)
+        for q in quantiles:
+            summary.loc[numeric, f'{q:.0%}'] = [self.sketches[column].quantile(q) for column in numeric]
+        summary.loc[numeric, 'max'] = np.where(has_values, self.moments.maximum, np.nan)
+        summary['distinct'] = [round(self.distinct[column].estimate()) for column in self.columns]
+        return summary
+
+    def distinct_standard_error(self):
+        """
+        Relative standard error of the distinct counts.
+
+        Returns:
+            float: Relative standard error of each HyperLogLog estimate.
+        """
+        return 1.04 / np.sqrt(2 ** self.precision)
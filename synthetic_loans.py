@@ -0,0 +1,133 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import status
+
+
+class SyntheticLoanGenerator:
+    """
+    A class for generating synthetic loan payments data at any scale from a reference sample.
+
+    Rows are bootstrapped from the reference DataFrame, which keeps the joint distribution of
+    the columns (grade and interest rate, status and payments, missing values, ...), and then
+    perturbed: each loan's monetary columns are scaled by one lognormal factor so the amounts
+    stay consistent with each other, interest rates and incomes are jittered, and ids are
+    renumbered to be unique. Data is produced in chunks, so files of 1e8 rows can be written
+    without holding them in memory.
+
+    Attributes:
+        reference (pd.DataFrame): Reference sample with the loan payments schema. Defaults to updated_loan_payments.csv.
+        seed (int, optional): Seed for reproducible data.
+        amount_noise (float): Standard deviation of the log of the per-loan amount scale factor.
+
+    Methods:
+        generate(rows): Generate a DataFrame of synthetic loans.
+        generate_chunks(rows, chunk_size=1000000): Yield synthetic loans as DataFrame chunks.
+        write_csv(file_path, rows, chunk_size=1000000): Write synthetic loans to a CSV file chunk by chunk.
+        write_parquet(file_path, rows, chunk_size=1000000): Write synthetic loans to a Parquet file chunk by chunk.
+    """
+    AMOUNT_COLUMNS = [
+        "loan_amount", "funded_amount", "funded_amount_inv", "instalment", "out_prncp", "out_prncp_inv",
+        "total_payment", "total_payment_inv", "total_rec_prncp", "total_rec_int", "total_rec_late_fee",
+        "recoveries", "collection_recovery_fee", "last_payment_amount"
+    ]
+
+    def __init__(self, reference=None, seed=None, amount_noise=0.1):
+        if reference is None:
+            reference = os.path.join(os.path.dirname(os.path.abspath(__file__)), "updated_loan_payments.csv")
+        if isinstance(reference, str):
+            reference = pd.read_csv(reference)
+        self.reference = reference.drop(columns=[column for column in reference.columns if column.startswith("Unnamed")])
+        self.seed = seed
+        self.amount_noise = amount_noise
+        self._rng = np.random.default_rng(seed)
+
+    def generate(self, rows):
+        """
+        Generate a DataFrame of synthetic loans.
+
+        Args:
+            rows (int): Number of rows.
+
+        Returns:
+            pd.DataFrame: Synthetic loans with the reference columns and dtypes.
+        """
+        return self._chunk(int(rows), 0)
+
+    def generate_chunks(self, rows, chunk_size=1000000):
+        """
+        Yield synthetic loans as DataFrame chunks.
+
+        Args:
+            rows (int): Total number of rows.
+            chunk_size (int): Number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: Chunk of synthetic loans with consecutive unique ids.
+        """
+        rows = int(rows)
+        for start in range(0, rows, chunk_size):
+            yield self._chunk(min(chunk_size, rows - start), start)
+
+    def write_csv(self, file_path, rows, chunk_size=1000000):
+        """
+        Write synthetic loans to a CSV file chunk by chunk.
+
+        Args:
+            file_path (str): Path of the CSV file.
+            rows (int): Total number of rows.
+            chunk_size (int): Number of rows generated and written at a time.
+        """
+        for position, chunk in enumerate(self.generate_chunks(rows, chunk_size)):
+            chunk.to_csv(file_path, mode="w" if position == 0 else "a", header=position == 0, index=False)
+        status(f"{int(rows)} synthetic loans written to {file_path}.")
+
+    def write_parquet(self, file_path, rows, chunk_size=1000000):
+        """
+        Write synthetic loans to a Parquet file chunk by chunk, one row group per chunk.
+
+        Args:
+            file_path (str): Path of the Parquet file.
+            rows (int): Total number of rows.
+            chunk_size (int): Number of rows generated and written at a time.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for chunk in self.generate_chunks(rows, chunk_size):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(file_path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        status(f"{int(rows)} synthetic loans written to {file_path}.")
+
+    def _chunk(self, rows, start):
+        """
+        Bootstrap and perturb one chunk of rows, numbering ids from start.
+        """
+        rng = self._rng
+        chunk = self.reference.iloc[rng.integers(0, len(self.reference), rows)].reset_index(drop=True)
+        scale = np.exp(rng.normal(0, self.amount_noise, rows))
+        for column in self.AMOUNT_COLUMNS:
+            if column in chunk:
+                values = chunk[column].to_numpy(dtype=float, na_value=np.nan) * scale
+                if pd.api.types.is_integer_dtype(chunk[column]):
+                    chunk[column] = np.rint(values).astype(chunk[column].dtype)
+                else:
+                    chunk[column] = np.round(values, 2)
+        if "int_rate" in chunk:
+            chunk["int_rate"] = np.round(np.clip(chunk["int_rate"] + rng.normal(0, 0.25, rows), 0.01, None), 2)
+        if "annual_inc" in chunk:
+            chunk["annual_inc"] = np.round(chunk["annual_inc"] * np.exp(rng.normal(0, 0.1, rows)), 0)
+        ids = np.arange(start + 1, start + rows + 1)
+        if "id" in chunk:
+            chunk["id"] = ids
+        if "member_id" in chunk:
+            chunk["member_id"] = ids + 10 ** 9
+        return chunk